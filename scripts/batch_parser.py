@@ -12,12 +12,25 @@ Batch PDF Parser - 대량 PDF 일괄 처리 시스템
 import argparse
 import csv
 import json
+import multiprocessing
+import os
+import queue
+import random
+import re
+import shutil
+import threading
 import time
-from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
+from itertools import islice
+from operator import attrgetter
 from pathlib import Path
 
+from src.jsonio import dumps_bytes, loads, read_json, write_bytes
+
 
 @dataclass
 class BatchResult:
@@ -32,6 +45,9 @@ class BatchResult:
     cost_usd: float = 0.0
     time_seconds: float = 0.0
     error_message: str = ""
+    error_type: str = ""
+    error_kind: str = ""  # "rate_limit", "transient", "unrecoverable" (set on error)
+    retry_after: float | None = None
     output_file: str = ""
 
 
@@ -53,16 +69,166 @@ class BatchStats:
     results: list = field(default_factory=list)
 
 
+# Parser module cached per worker by _init_worker, so each task skips the import machinery
+_WORKER_PARSER_MOD = None
+
+# --output-format ndjson: one append-mode shard per worker process, shared by its threads
+# (named apart from the batch_results.csv/.ndjson status log, which holds one status row per PDF)
+NDJSON_RESULTS_NAME = "parsed_exams.ndjson"
+NDJSON_SHARD_GLOB = "parsed_exams.worker-*.ndjson"
+_SHARD_FILE = None
+_SHARD_LOCK = threading.Lock()
+
+
+def _init_worker():
+    """Pool initializer: import the parser stack once per worker instead of once per task."""
+    global _WORKER_PARSER_MOD
+    import src.parser as parser_mod
+
+    _WORKER_PARSER_MOD = parser_mod
+
+
+_SAFE_NAME_TRANS = str.maketrans(" /", "__")
+
+
+def _safe_name(pdf_path: str) -> str:
+    """Output file stem for a PDF: its stem with spaces/slashes replaced by underscores."""
+    return os.path.splitext(os.path.basename(pdf_path))[0].translate(_SAFE_NAME_TRANS)
+
+
+def _output_path(output_dir: str, safe_name: str) -> Path:
+    """Per-PDF result file: <output_dir>/<safe_name>.json"""
+    return Path(output_dir) / f"{safe_name}.json"
+
+
+def _has_valid_output(output_dir: str, safe_name: str) -> bool:
+    """True if a previous run already wrote a parsable result with at least one question."""
+    out_file = _output_path(output_dir, safe_name)
+    if not out_file.is_file():
+        return False
+    try:
+        return len(read_json(out_file)["parsed_exam"]["questions"]) > 0
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+
+
+def _pool_mp_context():
+    """Start method for the OCR process pool.
+
+    Pool processes start lazily on the first submit(), from the producer thread
+    while tqdm's monitor and the executor's management thread are running, and
+    forking a multithreaded parent can deadlock. So the default is forkserver
+    (spawn where unavailable); the fork server preloads the parser stack once so
+    workers still skip re-importing it. BATCH_MP_START_METHOD (fork/spawn/forkserver)
+    overrides the choice — fork only ever runs when asked for there.
+    """
+    override = os.getenv("BATCH_MP_START_METHOD")
+    if override:
+        return multiprocessing.get_context(override)
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    ctx = multiprocessing.get_context("forkserver")
+    ctx.set_forkserver_preload(["src.parser"])
+    return ctx
+
+
+def _append_shard(output_dir: str, record: bytes) -> Path:
+    """Append one NDJSON record to this process's shard (opened once, kept open for the batch)."""
+    global _SHARD_FILE
+    with _SHARD_LOCK:
+        if _SHARD_FILE is None:
+            _SHARD_FILE = open(Path(output_dir) / f"parsed_exams.worker-{os.getpid()}.ndjson", "ab")
+        _SHARD_FILE.write(record + b"\n")
+        # Pool workers may exit via os._exit, so don't leave records in the userspace buffer
+        _SHARD_FILE.flush()
+    return Path(output_dir) / NDJSON_RESULTS_NAME
+
+
+def _ends_with_newline(path: Path) -> bool:
+    """True if path is empty or its last byte is a newline."""
+    with open(path, "rb") as f:
+        if f.seek(0, os.SEEK_END) == 0:
+            return True
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b"\n"
+
+
+def _merge_shards(output_dir: str) -> Path:
+    """Concatenate per-worker shards into output_dir/parsed_exams.ndjson and remove them.
+
+    Also run at start-up, so shards left behind by a killed run are folded in
+    (and count towards resume) instead of lingering next to the merged file.
+    """
+    global _SHARD_FILE
+    with _SHARD_LOCK:
+        if _SHARD_FILE is not None:  # thread-pool runs write the shard from this process
+            _SHARD_FILE.close()
+            _SHARD_FILE = None
+    merged = Path(output_dir) / NDJSON_RESULTS_NAME
+    with open(merged, "ab") as out:
+        # A killed run can leave a torn last line; start the next record on a fresh line
+        if not _ends_with_newline(merged):
+            out.write(b"\n")
+        for shard in sorted(Path(output_dir).glob(NDJSON_SHARD_GLOB)):
+            with open(shard, "rb") as f:
+                shutil.copyfileobj(f, out)
+            if not _ends_with_newline(shard):
+                out.write(b"\n")
+            shard.unlink()
+    return merged
+
+
+def _drop_ndjson_records(output_dir: str, pdf_paths) -> None:
+    """Rewrite output_dir/parsed_exams.ndjson without the records for pdf_paths (--force re-runs)."""
+    merged = Path(output_dir) / NDJSON_RESULTS_NAME
+    if not merged.is_file():
+        return
+    drop = set(pdf_paths)
+    # Write-then-rename, as for per-PDF results: a crash keeps the old file intact
+    tmp = merged.with_suffix(".ndjson.tmp")
+    with open(merged, "rb") as f, open(tmp, "wb") as out:
+        for line in f:
+            try:
+                if loads(line)["pdf_path"] in drop:
+                    continue
+            except (ValueError, KeyError, TypeError):
+                continue  # torn line from a killed run
+            out.write(line)
+    os.replace(tmp, merged)
+
+
+def _completed_in_ndjson(output_dir: str) -> set[str]:
+    """pdf_paths already recorded with at least one question in output_dir/parsed_exams.ndjson."""
+    done = set()
+    merged = Path(output_dir) / NDJSON_RESULTS_NAME
+    if not merged.is_file():
+        return done
+    with open(merged, "rb") as f:
+        for line in f:
+            try:
+                data = loads(line)
+                if data["parsed_exam"]["questions"]:
+                    done.add(data["pdf_path"])
+            except (ValueError, KeyError, TypeError):
+                continue
+    return done
+
+
 def parse_single_pdf(pdf_path: str, model_name: str, output_dir: str,
-                     dpi: int = 200, instruction: str | None = None) -> BatchResult:
-    """Parse a single PDF file. Designed to run in a subprocess."""
-    from src.parser import ExamParser
+                     dpi: int = 200, instruction: str | None = None,
+                     output_format: str = "per-pdf", safe_name: str | None = None) -> BatchResult:
+    """Parse a single PDF file. Designed to run in a subprocess.
+
+    run_batch passes the precomputed ``safe_name``; standalone callers can omit it.
+    """
+    if _WORKER_PARSER_MOD is None:
+        _init_worker()
 
     result = BatchResult(pdf_path=pdf_path, model_name=model_name)
     start = time.time()
 
     try:
-        parser = ExamParser(pdf_path, dpi=dpi)
+        parser = _checked_parser(pdf_path, model_name, dpi)
         parse_result = parser.parse_with_model(model_name, instruction=instruction)
 
         result.status = "success"
@@ -74,57 +240,167 @@ def parse_single_pdf(pdf_path: str, model_name: str, output_dir: str,
         result.time_seconds = time.time() - start
 
         # Save individual result
-        if output_dir:
-            safe_name = Path(pdf_path).stem.replace("/", "_").replace(" ", "_")
-            out_file = Path(output_dir) / f"{safe_name}.json"
-            with open(out_file, "w", encoding="utf-8") as f:
-                json.dump(parse_result.model_dump(), f, ensure_ascii=False, indent=2)
+        if output_dir and output_format == "ndjson":
+            record = {"pdf_path": pdf_path, **parse_result.model_dump()}
+            result.output_file = str(_append_shard(output_dir, dumps_bytes(record, indent=False)))
+        elif output_dir:
+            out_file = _output_path(output_dir, safe_name or _safe_name(pdf_path))
+            # Write-then-rename: a crash never leaves a truncated <stem>.json for resume to trust
+            tmp_file = out_file.with_suffix(".json.tmp")
+            tmp_file.write_bytes(parse_result.model_dump_json(indent=2).encode("utf-8"))
+            os.replace(tmp_file, out_file)
             result.output_file = str(out_file)
 
     except Exception as e:
         result.status = "error"
         result.error_message = f"{type(e).__name__}: {str(e)}"
+        result.error_type = type(e).__name__
+        result.error_kind = _classify_exception(e)
+        result.retry_after = _extract_retry_after(e)
         result.time_seconds = time.time() - start
 
     return result
 
 
+class InvalidInputError(Exception):
+    """A problem with the batch input itself (unreadable/non-PDF file, unknown model, bad DPI)."""
+
+
+def _checked_parser(pdf_path: str, model_name: str, dpi: int):
+    """ExamParser for pdf_path after the input pre-checks; failures raise InvalidInputError."""
+    try:
+        with open(pdf_path, "rb") as f:
+            head = f.read(1024)
+    except OSError as e:
+        raise InvalidInputError(f"Cannot read {pdf_path}: {e}") from e
+    if b"%PDF-" not in head:
+        raise InvalidInputError(f"Not a PDF file: {pdf_path}")
+    if model_name not in _WORKER_PARSER_MOD.MODEL_CONFIG:
+        raise InvalidInputError(f"Unsupported model: {model_name}")
+    try:
+        return _WORKER_PARSER_MOD.ExamParser(pdf_path, dpi=dpi)
+    except ValueError as e:  # PDFParser's DPI range check
+        raise InvalidInputError(str(e)) from e
+
+
+# Deterministic failures — retrying cannot succeed. Only errors from the input pre-checks
+# and file opens count; ValueError/KeyError/ValidationError raised while OCR or the LLM
+# runs (e.g. a malformed response) stay retryable.
+_UNRECOVERABLE_EXCEPTIONS = (InvalidInputError, FileNotFoundError, PermissionError, IsADirectoryError)
+_RATE_LIMIT_ERROR_TYPES = frozenset({"RateLimitError", "ResourceExhausted", "TooManyRequests"})
+_RATE_LIMIT_MESSAGE_RE = re.compile(r"\b429\b|rate.?limit|resource.?exhausted|quota", re.IGNORECASE)
+# "Retry-After: 12" / "retry_after=12" (seconds, as in the HTTP header) or "retry in 12s" / "retry in 1.5 seconds"
+_RETRY_AFTER_RE = re.compile(
+    r"retry[-_ ]after[:=]?\s*(\d+(?:\.\d+)?)|retry\s+in\s+(\d+(?:\.\d+)?)\s*s(?:ec(?:ond)?s?)?\b", re.IGNORECASE
+)
+
+
+def _extract_retry_after(exc: Exception) -> float | None:
+    """Return the server-suggested retry delay (seconds) from an exception, if any."""
+    retry_after = getattr(exc, "retry_after", None)
+    if retry_after is None:
+        headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+        retry_after = headers.get("Retry-After") if hasattr(headers, "get") else None
+    if retry_after is None:
+        m = _RETRY_AFTER_RE.search(str(exc))
+        retry_after = (m.group(1) or m.group(2)) if m else None
+    try:
+        return float(retry_after) if retry_after is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _classify_exception(exc: Exception) -> str:
+    """Classify a worker exception as "rate_limit", "transient" or "unrecoverable".
+
+    Runs inside the worker where the exception object is still available, so
+    isinstance checks work across provider SDK subclasses.
+    """
+    # Input errors first: their messages carry file paths, which may well contain "429" or "quota"
+    if isinstance(exc, _UNRECOVERABLE_EXCEPTIONS):
+        return "unrecoverable"
+    if type(exc).__name__ in _RATE_LIMIT_ERROR_TYPES or _RATE_LIMIT_MESSAGE_RE.search(str(exc)):
+        return "rate_limit"
+    return "transient"
+
+
 def parse_with_retry(pdf_path: str, model_name: str, output_dir: str,
                      max_retries: int = 3, dpi: int = 200,
-                     instruction: str | None = None) -> BatchResult:
-    """Parse with retry logic for transient failures."""
+                     instruction: str | None = None,
+                     base_delay: float = 1.0, max_delay: float = 30.0,
+                     jitter: float = 0.5, output_format: str = "per-pdf",
+                     safe_name: str | None = None) -> BatchResult:
+    """Parse with retry logic for transient failures.
+
+    Uses capped exponential backoff with jitter so parallel workers hitting the same
+    provider limit don't retry in lockstep. Rate-limit errors wait at least the server's
+    Retry-After hint (jittered upwards); unrecoverable errors return immediately without retrying.
+    """
     last_result = None
     for attempt in range(max_retries):
-        result = parse_single_pdf(pdf_path, model_name, output_dir, dpi, instruction)
+        result = parse_single_pdf(pdf_path, model_name, output_dir, dpi, instruction, output_format, safe_name)
         if result.status == "success":
             return result
         last_result = result
+        if result.error_kind == "unrecoverable":
+            break  # deterministic failure: no retry, no backoff sleep
         if attempt < max_retries - 1:
-            delay = 2 ** attempt  # exponential backoff
+            if result.error_kind == "rate_limit" and result.retry_after is not None:
+                # Jitter only adds on top of the hint, so workers sharing one 429 don't wake together
+                delay = min(max_delay, result.retry_after) * (1 + random.random() * jitter)
+            else:
+                delay = min(max_delay, base_delay * 2 ** attempt * (1 + random.random() * jitter))
             time.sleep(delay)
     return last_result
 
 
-def find_pdf_files(directory: str) -> list:
-    """Recursively find all PDF files in directory."""
-    pdf_dir = Path(directory)
-    if not pdf_dir.exists():
+def _walk_pdfs(directory: str):
+    """Yield PDF paths depth-first, sorted within each directory, without materializing the tree."""
+    for root, dirnames, filenames in os.walk(directory):
+        dirnames.sort()  # in-place: os.walk descends in this order
+        for name in sorted(filenames):
+            if name.endswith(".pdf"):
+                yield os.path.join(root, name)
+
+
+def find_pdf_files(directory: str, limit: int | None = None) -> list:
+    """Recursively find PDF files in directory, stopping after `limit` hits if given."""
+    if not Path(directory).exists():
         raise FileNotFoundError(f"Directory not found: {directory}")
-    pdfs = sorted(pdf_dir.rglob("*.pdf"))
-    return [str(p) for p in pdfs]
+    return list(islice(_walk_pdfs(directory), limit))
+
+
+# Default concurrency ceiling for API-only models (provider rate limits, not CPU, are the bound)
+API_WORKER_CAP = 16
+
+# Minimum seconds between progress-bar postfix updates
+POSTFIX_INTERVAL = 0.25
+
+# Circuit breaker: look at the last N completions and stop if too many of them failed
+CIRCUIT_BREAKER_WINDOW = 20
+
+# Sentinel the submission thread puts on the completion queue once every PDF is submitted
+_PRODUCER_DONE = object()
+
+CSV_FIELDNAMES = (
+    "pdf_path", "status", "model_name", "questions_parsed",
+    "total_questions_expected", "input_tokens", "output_tokens",
+    "cost_usd", "time_seconds", "error_message", "error_type", "error_kind", "retry_after", "output_file"
+)
+# Builds a CSV row tuple by direct attribute access (no asdict() deep copy, no DictWriter lookups)
+_csv_row = attrgetter(*CSV_FIELDNAMES)
 
 
 def save_csv_report(stats: BatchStats, output_path: str):
-    """Save batch results as CSV."""
+    """Save in-memory batch results as CSV.
+
+    run_batch streams rows to batch_results.csv as PDFs complete; this is only
+    needed for callers that build BatchStats.results themselves.
+    """
     with open(output_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=[
-            "pdf_path", "status", "model_name", "questions_parsed",
-            "total_questions_expected", "input_tokens", "output_tokens",
-            "cost_usd", "time_seconds", "error_message", "output_file"
-        ])
-        writer.writeheader()
-        for r in stats.results:
-            writer.writerow(asdict(r))
+        writer = csv.writer(f)
+        writer.writerow(CSV_FIELDNAMES)
+        writer.writerows(_csv_row(r) for r in stats.results)
 
 
 def save_json_report(stats: BatchStats, output_path: str):
@@ -146,10 +422,11 @@ def save_json_report(stats: BatchStats, output_path: str):
             "start_time": stats.start_time,
             "end_time": stats.end_time,
         },
-        "results": [asdict(r) for r in stats.results],
     }
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(summary, f, ensure_ascii=False, indent=2)
+    # Per-PDF rows are only kept in memory with --keep-results; otherwise they live in batch_results.csv/.ndjson
+    if stats.results:
+        summary["results"] = [asdict(r) for r in stats.results]
+    write_bytes(output_path, dumps_bytes(summary))
 
 
 def run_batch(
@@ -162,6 +439,11 @@ def run_batch(
     instruction: str | None = None,
     cost_limit: float | None = None,
     file_limit: int | None = None,
+    max_workers_cap: int | None = None,
+    keep_results: bool = False,
+    force: bool = False,
+    output_format: str = "per-pdf",
+    fail_fast_threshold: int = 15,
 ) -> BatchStats:
     """
     Run batch processing on all PDFs in a directory.
@@ -176,13 +458,25 @@ def run_batch(
         instruction: Custom parsing instruction
         cost_limit: Stop if total cost exceeds this (USD)
         file_limit: Maximum number of files to process
+        max_workers_cap: Extra upper bound on parallel workers, applied after
+            the per-model caps (1 for GPU-heavy OCR, min(workers, 2, CPU count)
+            for other hybrids, min(workers, API_WORKER_CAP) for API-only models).
+            None adds no further bound.
+        keep_results: Keep every BatchResult in stats.results (and in
+            batch_summary.json). Off by default: rows are streamed to disk and
+            only the running counters are held in memory.
+        force: Re-parse PDFs even if output_dir already holds a valid result
+            for them (by default those are skipped, so interrupted runs resume).
+        output_format: "per-pdf" writes <stem>.json per PDF; "ndjson" appends
+            every result to per-worker shards merged into parsed_exams.ndjson
+            (with force, earlier records for these PDFs are dropped first).
+        fail_fast_threshold: Stop the batch once this many of the last
+            CIRCUIT_BREAKER_WINDOW PDFs failed (0 disables the breaker)
     """
     from tqdm import tqdm
 
     # Find PDFs
-    pdf_files = find_pdf_files(pdf_dir)
-    if file_limit:
-        pdf_files = pdf_files[:file_limit]
+    pdf_files = find_pdf_files(pdf_dir, limit=file_limit or None)
 
     if not pdf_files:
         print(f"No PDF files found in {pdf_dir}")
@@ -199,100 +493,198 @@ def run_batch(
         start_time=datetime.now().isoformat(),
     )
 
+    # Determine worker count and executor type
+    is_hybrid = "+" in model_name
+    gpu_heavy_ocr = any(engine in model_name for engine in ("trocr", "deepseek"))
+    cpu_cap = os.cpu_count() or 4
+    if gpu_heavy_ocr:
+        effective_workers = 1
+    elif is_hybrid:
+        # CPU-bound OCR: more workers than cores only adds contention
+        effective_workers = min(workers, 2, cpu_cap)
+    else:
+        # API-only: bound concurrency so a large -w doesn't trip provider 429s
+        effective_workers = min(workers, API_WORKER_CAP)
+    if max_workers_cap:
+        effective_workers = min(effective_workers, max_workers_cap)
+    effective_workers = max(1, effective_workers)
+
     print(f"\n{'='*60}")
     print("Batch PDF Parser")
     print(f"{'='*60}")
     print(f"  Directory: {pdf_dir}")
     print(f"  PDF files: {len(pdf_files)}")
     print(f"  Model: {model_name}")
-    print(f"  Workers: {workers}")
+    if effective_workers != workers:
+        print(f"  Workers: {effective_workers} (capped from {workers})")
+    else:
+        print(f"  Workers: {workers}")
     print(f"  Max retries: {max_retries}")
     if cost_limit:
         print(f"  Cost limit: ${cost_limit:.2f}")
     print(f"{'='*60}\n")
 
-    # Determine worker count and executor type
-    is_hybrid = "+" in model_name
-    gpu_heavy_ocr = any(engine in model_name for engine in ("trocr", "deepseek"))
-    if gpu_heavy_ocr:
-        effective_workers = 1
-    elif is_hybrid:
-        effective_workers = min(workers, 2)
-    else:
-        effective_workers = workers
-
     # Use ThreadPoolExecutor for API-only models (no subprocess overhead)
     PoolExecutor = ProcessPoolExecutor if is_hybrid else ThreadPoolExecutor
 
     cost_exceeded = False
-    pdf_queue = list(pdf_files)
-    queue_idx = 0
+    circuit_open = False
+    window_failures = 0
+    # Output names are derived once here rather than re-parsed from the path in every task
+    safe_names = {pdf_path: _safe_name(pdf_path) for pdf_path in pdf_files}
+    if output_dir and output_format == "ndjson":
+        _merge_shards(output_dir)
+        if force:
+            _drop_ndjson_records(output_dir, pdf_files)
+    # Resume: PDFs that already have a valid result in output_dir are not re-parsed (or re-paid for)
+    if output_dir and not force:
+        pdf_queue, already_done = [], []
+        recorded = _completed_in_ndjson(output_dir) if output_format == "ndjson" else None
+        for pdf_path in pdf_files:
+            done = pdf_path in recorded if recorded is not None else _has_valid_output(output_dir, safe_names[pdf_path])
+            (already_done if done else pdf_queue).append(pdf_path)
+        if already_done:
+            print(f"Skipping {len(already_done)} PDF(s) with existing results (use --force to re-parse)\n")
+    else:
+        pdf_queue, already_done = list(pdf_files), []
     max_pending = effective_workers * 2
 
-    with PoolExecutor(max_workers=effective_workers) as executor:
-        pending = set()
-
-        # Submit initial batch
-        initial_count = min(max_pending, len(pdf_queue))
-        for i in range(initial_count):
-            future = executor.submit(
-                parse_with_retry,
-                pdf_queue[i], model_name, output_dir or "",
-                max_retries, dpi, instruction
-            )
-            pending.add(future)
-        queue_idx = initial_count
-
-        with tqdm(total=len(pdf_files), desc="Processing", unit="pdf") as pbar:
-            while pending:
-                done, pending = wait(pending, return_when=FIRST_COMPLETED)
-
-                for future in done:
-                    result = future.result()
+    with ExitStack() as stack:
+        # Stream per-PDF rows to disk as they complete: the CSV doubles as a live
+        # progress log and nothing is lost if the run is killed mid-way.
+        csv_writer = ndjson_f = None
+        if output_dir:
+            csv_f = stack.enter_context(open(
+                Path(output_dir) / "batch_results.csv", "w", newline="", encoding="utf-8", buffering=1
+            ))
+            csv_writer = csv.writer(csv_f)
+            csv_writer.writerow(CSV_FIELDNAMES)
+            ndjson_f = stack.enter_context(open(
+                Path(output_dir) / "batch_results.ndjson", "w", encoding="utf-8", buffering=1
+            ))
+
+        for pdf_path in already_done:
+            stats.skipped += 1
+            if csv_writer is not None:
+                row = _csv_row(BatchResult(
+                    pdf_path=pdf_path, status="skipped", model_name=model_name,
+                    output_file=str(
+                        Path(output_dir) / NDJSON_RESULTS_NAME if output_format == "ndjson"
+                        else _output_path(output_dir, safe_names[pdf_path])
+                    ),
+                ))
+                csv_writer.writerow(row)
+                ndjson_f.write(json.dumps(dict(zip(CSV_FIELDNAMES, row)), ensure_ascii=False) + "\n")
+
+        # Workers persist for the whole batch; the initializer loads the parser stack once each
+        pool_kwargs = {}
+        if is_hybrid:
+            pool_kwargs["mp_context"] = _pool_mp_context()
+        executor = stack.enter_context(
+            PoolExecutor(max_workers=effective_workers, initializer=_init_worker, **pool_kwargs)
+        )
+
+        # Backpressure: the producer thread holds at most max_pending futures in flight and
+        # finished futures are pushed onto done_q by their callbacks, so the consumer never
+        # re-scans the pending set.
+        sem = threading.Semaphore(max_pending)
+        stop = threading.Event()
+        done_q: queue.SimpleQueue = queue.SimpleQueue()
+        submitted = [0]
+
+        def _produce():
+            for pdf_path in pdf_queue:
+                sem.acquire()
+                if stop.is_set():
+                    break
+                try:
+                    future = executor.submit(
+                        parse_with_retry,
+                        pdf_path, model_name, output_dir or "",
+                        max_retries, dpi, instruction,
+                        output_format=output_format, safe_name=safe_names[pdf_path],
+                    )
+                except RuntimeError:  # executor shut down by the cost-limit stop
+                    break
+                submitted[0] += 1
+                future.add_done_callback(done_q.put)
+            done_q.put(_PRODUCER_DONE)
+
+        producer = threading.Thread(target=_produce, name="batch-producer", daemon=True)
+        producer.start()
+
+        with tqdm(total=len(pdf_queue), desc="Processing", unit="pdf") as pbar:
+            handled = 0
+            producer_done = False
+            last_postfix_t = 0.0
+            recent_ok: deque[bool] = deque(maxlen=CIRCUIT_BREAKER_WINDOW)
+            while not producer_done or handled < submitted[0]:
+                future = done_q.get()
+                if future is _PRODUCER_DONE:
+                    producer_done = True
+                    continue
+                handled += 1
+                sem.release()
+                if future.cancelled():
+                    continue
+
+                result = future.result()
+                if keep_results:
                     stats.results.append(result)
-                    stats.processed += 1
-
-                    if result.status == "success":
-                        stats.succeeded += 1
-                        stats.total_tokens_input += result.input_tokens
-                        stats.total_tokens_output += result.output_tokens
-                        stats.total_cost_usd += result.cost_usd
-                        stats.total_time_seconds += result.time_seconds
-                        pbar.set_postfix({
-                            "ok": stats.succeeded,
-                            "fail": stats.failed,
-                            "cost": f"${stats.total_cost_usd:.4f}"
-                        })
-                    elif result.status == "error":
-                        stats.failed += 1
-                        pbar.set_postfix({
-                            "ok": stats.succeeded,
-                            "fail": stats.failed,
-                            "last_err": result.error_message[:30]
-                        })
-                    else:
-                        stats.skipped += 1
-
-                    pbar.update(1)
-
-                # Check cost limit before submitting more
+                stats.processed += 1
+                if csv_writer is not None:
+                    row = _csv_row(result)
+                    csv_writer.writerow(row)
+                    ndjson_f.write(json.dumps(dict(zip(CSV_FIELDNAMES, row)), ensure_ascii=False) + "\n")
+
+                # Postfix redraws go through tqdm's lock + a stderr write; cap them at ~4 Hz
+                now = time.monotonic()
+                refresh_postfix = now - last_postfix_t > POSTFIX_INTERVAL
+                if result.status == "success":
+                    stats.succeeded += 1
+                    stats.total_tokens_input += result.input_tokens
+                    stats.total_tokens_output += result.output_tokens
+                    stats.total_cost_usd += result.cost_usd
+                    stats.total_time_seconds += result.time_seconds
+                    if refresh_postfix:
+                        pbar.set_postfix_str(
+                            f"ok={stats.succeeded}, fail={stats.failed}, cost=${stats.total_cost_usd:.4f}",
+                            refresh=False,
+                        )
+                        last_postfix_t = now
+                elif result.status == "error":
+                    stats.failed += 1
+                    if refresh_postfix:
+                        pbar.set_postfix_str(
+                            f"ok={stats.succeeded}, fail={stats.failed}, last_err={result.error_message[:30]}",
+                            refresh=False,
+                        )
+                        last_postfix_t = now
+                else:
+                    stats.skipped += 1
+
+                pbar.update(1)
+                recent_ok.append(result.status == "success")
+
+                # Stop submitting once the cost limit is hit; in-flight work is cancelled
                 if cost_limit and stats.total_cost_usd >= cost_limit:
                     print(f"\n[COST LIMIT] Reached ${stats.total_cost_usd:.4f} >= ${cost_limit:.2f}. Stopping.")
                     cost_exceeded = True
-                    for f in pending:
-                        f.cancel()
-                    pending.clear()
+                # Provider outages fail at zero cost, so the cost limit never trips on them
+                elif (fail_fast_threshold and len(recent_ok) == CIRCUIT_BREAKER_WINDOW
+                        and recent_ok.count(False) >= fail_fast_threshold):
+                    window_failures = recent_ok.count(False)
+                    print(f"\n[CIRCUIT BREAKER] {window_failures} of the last {CIRCUIT_BREAKER_WINDOW} "
+                          f"PDFs failed (last: {result.error_message[:80]}). Stopping.")
+                    circuit_open = True
+
+                if cost_exceeded or circuit_open:
+                    stop.set()
+                    sem.release()  # unblock the producer so it can observe the stop flag
+                    executor.shutdown(wait=False, cancel_futures=True)
                     break
 
-                # Submit more work up to max_pending
-                while queue_idx < len(pdf_queue) and len(pending) < max_pending:
-                    future = executor.submit(
-                        parse_with_retry,
-                        pdf_queue[queue_idx], model_name, output_dir or "",
-                        max_retries, dpi, instruction
-                    )
-                    pending.add(future)
-                    queue_idx += 1
+        producer.join()
 
     stats.end_time = datetime.now().isoformat()
 
@@ -312,11 +704,15 @@ def run_batch(
         print(f"  Avg time/PDF: {stats.total_time_seconds / stats.succeeded:.1f}s")
     if cost_exceeded:
         print("  [!] Stopped early due to cost limit")
+    if circuit_open:
+        print(f"  [!] Stopped early: {window_failures} of the last {CIRCUIT_BREAKER_WINDOW} PDFs failed "
+              "(circuit breaker)")
     print(f"{'='*60}\n")
 
-    # Save reports
+    # Save reports (per-PDF rows were already streamed to batch_results.csv/.ndjson)
     if output_dir:
-        save_csv_report(stats, str(Path(output_dir) / "batch_results.csv"))
+        if output_format == "ndjson":
+            _merge_shards(output_dir)
         save_json_report(stats, str(Path(output_dir) / "batch_summary.json"))
         print(f"Reports saved to {output_dir}/")
 
@@ -336,6 +732,20 @@ def main():
     parser.add_argument("--instruction", type=str, default=None, help="Custom parsing instruction")
     parser.add_argument("--cost-limit", type=float, default=None, help="Stop if total cost exceeds this USD amount")
     parser.add_argument("--file-limit", type=int, default=None, help="Maximum number of files to process")
+    parser.add_argument("--max-workers-cap", type=int, default=None,
+                        help=f"Extra upper bound on parallel workers (default: none). The per-model caps "
+                             f"always apply: 1 for GPU-heavy OCR, min(-w, 2, CPU count) for other OCR "
+                             f"hybrids, min(-w, {API_WORKER_CAP}) for API-only models")
+    parser.add_argument("--output-format", choices=("per-pdf", "ndjson"), default="per-pdf",
+                        help="per-pdf: one <stem>.json per PDF; ndjson: all results in parsed_exams.ndjson "
+                             "(default: per-pdf)")
+    parser.add_argument("--fail-fast-threshold", type=int, default=15,
+                        help=f"Stop when this many of the last {CIRCUIT_BREAKER_WINDOW} PDFs failed "
+                             f"(0 disables, default: 15)")
+    parser.add_argument("--force", action="store_true",
+                        help="Re-parse PDFs that already have a valid result in the output directory")
+    parser.add_argument("--keep-results", action=argparse.BooleanOptionalAction, default=False,
+                        help="Keep per-PDF results in memory and in batch_summary.json (default: off)")
 
     args = parser.parse_args()
 
@@ -349,6 +759,11 @@ def main():
         instruction=args.instruction,
         cost_limit=args.cost_limit,
         file_limit=args.file_limit,
+        max_workers_cap=args.max_workers_cap,
+        keep_results=args.keep_results,
+        force=args.force,
+        output_format=args.output_format,
+        fail_fast_threshold=args.fail_fast_threshold,
     )
 
 
@@ -14,133 +14,176 @@ Performance Benchmark Tool - OCR 엔진 + 모델 조합 벤치마크
 import argparse
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
+# Engines that load large models onto the GPU — benchmarked one at a time so they don't contend
+_GPU_HEAVY_ENGINES = ("mineru", "trocr", "deepseek")
 
-def benchmark_ocr_engines(pdf_path: str, dpi: int = 200) -> list:
-    """Benchmark all available OCR engines on a single PDF."""
-    from src.ocr import OCR_ENGINES, list_available_engines
-    from src.pdf_parser import PDFParser
 
-    pdf_parser = PDFParser(pdf_path, dpi=dpi)
-    images = pdf_parser.get_page_images_as_bytes()
-    num_pages = len(images)
+def _bench_one_engine(engine_name: str, info: dict, images: list, pdf_path: str) -> dict:
+    """Run a single OCR engine on the rendered pages and collect its metrics."""
+    from src.ocr import OCR_ENGINES
 
-    results = []
-    available = list_available_engines()
+    entry = {
+        "engine": engine_name,
+        "class": info["class"],
+        "available": info["available"],
+        "pages": len(images),
+        "chars_extracted": 0,
+        "init_time": 0.0,
+        "ocr_time": 0.0,
+        "total_time": 0.0,
+        "chars_per_second": 0.0,
+        "error": None,
+    }
 
-    for engine_name, info in available.items():
-        entry = {
-            "engine": engine_name,
-            "class": info["class"],
-            "available": info["available"],
-            "pages": num_pages,
-            "chars_extracted": 0,
-            "init_time": 0.0,
-            "ocr_time": 0.0,
-            "total_time": 0.0,
-            "chars_per_second": 0.0,
-            "error": None,
-        }
+    if not info["available"]:
+        entry["error"] = "Not installed"
+        return entry
 
-        if not info["available"]:
-            entry["error"] = "Not installed"
-            results.append(entry)
-            continue
+    try:
+        engine_cls = OCR_ENGINES[engine_name]
+        engine = engine_cls()
 
-        try:
-            engine_cls = OCR_ENGINES[engine_name]
-            engine = engine_cls()
+        # Special handling for pymupdf-text
+        if engine_name == "pymupdf-text":
+            engine.set_pdf_path(pdf_path)
 
-            # Special handling for pymupdf-text
-            if engine_name == "pymupdf-text":
-                engine.set_pdf_path(pdf_path)
+        text = engine.extract_text(images)
+        metrics = engine.get_metrics()
 
-            text = engine.extract_text(images)
-            metrics = engine.get_metrics()
+        entry["chars_extracted"] = len(text)
+        entry["init_time"] = metrics["init_time_seconds"]
+        entry["ocr_time"] = metrics["ocr_time_seconds"]
+        entry["total_time"] = metrics["total_time_seconds"]
+        entry["chars_per_second"] = round(
+            len(text) / metrics["ocr_time_seconds"], 1
+        ) if metrics["ocr_time_seconds"] > 0 else 0
 
-            entry["chars_extracted"] = len(text)
-            entry["init_time"] = metrics["init_time_seconds"]
-            entry["ocr_time"] = metrics["ocr_time_seconds"]
-            entry["total_time"] = metrics["total_time_seconds"]
-            entry["chars_per_second"] = round(
-                len(text) / metrics["ocr_time_seconds"], 1
-            ) if metrics["ocr_time_seconds"] > 0 else 0
+        # Extract sample for quality check
+        lines = text.split("\n")
+        entry["sample_lines"] = lines[:5]
 
-            # Extract sample for quality check
-            lines = text.split("\n")
-            entry["sample_lines"] = lines[:5]
+    except Exception as e:
+        entry["error"] = f"{type(e).__name__}: {str(e)}"
 
-        except Exception as e:
-            entry["error"] = f"{type(e).__name__}: {str(e)}"
+    return entry
 
-        results.append(entry)
 
-    return results
+def render_pages(pdf_path: str, dpi: int = 200) -> list:
+    """Rasterize the PDF once so every benchmark phase can share the page images."""
+    from src.pdf_parser import PDFParser
 
+    return PDFParser(pdf_path, dpi=dpi).get_page_images_as_bytes()
 
-def benchmark_models(pdf_path: str, model_names: list = None,
-                     dpi: int = 200) -> list:
-    """Benchmark parsing models (vision + hybrid) on a single PDF."""
-    from src.config import MODEL_CONFIG
-    from src.parser import ExamParser
-
-    if model_names is None:
-        model_names = list(MODEL_CONFIG.keys())
 
-    parser = ExamParser(pdf_path, dpi=dpi)
-    results = []
-
-    for model_name in model_names:
-        entry = {
-            "model": model_name,
-            "type": "hybrid" if "+" in model_name else "vision",
-            "provider": MODEL_CONFIG.get(model_name, {}).get("provider", "unknown"),
-            "questions_parsed": 0,
-            "total_questions": 45,
-            "completeness_pct": 0.0,
-            "input_tokens": 0,
-            "output_tokens": 0,
-            "total_tokens": 0,
-            "cost_usd": 0.0,
-            "time_seconds": 0.0,
-            "cost_per_question": 0.0,
-            "tokens_per_question": 0,
-            "error": None,
-        }
+def benchmark_ocr_engines(pdf_path: str, dpi: int = 200, images: list | None = None) -> list:
+    """Benchmark all available OCR engines on a single PDF.
 
-        try:
-            print(f"  Testing {model_name}...", end=" ", flush=True)
-            result = parser.parse_with_model(model_name)
+    GPU-heavy engines run serially; the rest run concurrently in a small thread
+    pool since their init and inference are independent of each other.
+    """
+    from src.ocr import list_available_engines
 
-            n_q = len(result.parsed_exam.questions)
-            total_q = result.parsed_exam.exam_info.total_questions
+    if images is None:
+        images = render_pages(pdf_path, dpi=dpi)
 
-            entry["questions_parsed"] = n_q
-            entry["total_questions"] = total_q
-            entry["completeness_pct"] = round(n_q / total_q * 100, 1) if total_q > 0 else 0
-            entry["input_tokens"] = result.total_tokens_input
-            entry["output_tokens"] = result.total_tokens_output
-            entry["total_tokens"] = result.total_tokens_input + result.total_tokens_output
-            entry["cost_usd"] = round(result.total_cost_usd, 6)
-            entry["time_seconds"] = round(result.parsing_time_seconds, 2)
-            entry["cost_per_question"] = round(result.total_cost_usd / n_q, 6) if n_q > 0 else 0
-            entry["tokens_per_question"] = round(entry["total_tokens"] / n_q) if n_q > 0 else 0
+    available = list_available_engines()
+    serial = [(name, info) for name, info in available.items() if name in _GPU_HEAVY_ENGINES]
+    parallel = [(name, info) for name, info in available.items() if name not in _GPU_HEAVY_ENGINES]
+
+    by_engine: dict[str, dict] = {}
+    for engine_name, info in serial:
+        by_engine[engine_name] = _bench_one_engine(engine_name, info, images, pdf_path)
+
+    if parallel:
+        with ThreadPoolExecutor(max_workers=min(4, len(parallel))) as executor:
+            futures = {
+                executor.submit(_bench_one_engine, engine_name, info, images, pdf_path): engine_name
+                for engine_name, info in parallel
+            }
+            for future in as_completed(futures):
+                by_engine[futures[future]] = future.result()
+
+    # Keep registry order in the report regardless of completion order
+    return [by_engine[name] for name in available]
+
+
+def _bench_one_model(parser, model_name: str, provider: str) -> dict:
+    """Parse the PDF with one model and collect its metrics."""
+    entry = {
+        "model": model_name,
+        "type": "hybrid" if "+" in model_name else "vision",
+        "provider": provider,
+        "questions_parsed": 0,
+        "total_questions": 45,
+        "completeness_pct": 0.0,
+        "input_tokens": 0,
+        "output_tokens": 0,
+        "total_tokens": 0,
+        "cost_usd": 0.0,
+        "time_seconds": 0.0,
+        "cost_per_question": 0.0,
+        "tokens_per_question": 0,
+        "error": None,
+    }
+
+    try:
+        result = parser.parse_with_model(model_name)
+
+        n_q = len(result.parsed_exam.questions)
+        total_q = result.parsed_exam.exam_info.total_questions
+
+        entry["questions_parsed"] = n_q
+        entry["total_questions"] = total_q
+        entry["completeness_pct"] = round(n_q / total_q * 100, 1) if total_q > 0 else 0
+        entry["input_tokens"] = result.total_tokens_input
+        entry["output_tokens"] = result.total_tokens_output
+        entry["total_tokens"] = result.total_tokens_input + result.total_tokens_output
+        entry["cost_usd"] = round(result.total_cost_usd, 6)
+        entry["time_seconds"] = round(result.parsing_time_seconds, 2)
+        entry["cost_per_question"] = round(result.total_cost_usd / n_q, 6) if n_q > 0 else 0
+        entry["tokens_per_question"] = round(entry["total_tokens"] / n_q) if n_q > 0 else 0
+
+        print(f"  {model_name}: {n_q}/{total_q} questions, ${entry['cost_usd']:.4f}, {entry['time_seconds']:.1f}s")
+
+        # Add OCR metrics for hybrid models
+        if "+" in model_name and result.ocr_metrics is not None:
+            entry["ocr_metrics"] = result.ocr_metrics
+
+    except Exception as e:
+        entry["error"] = f"{type(e).__name__}: {str(e)}"
+        print(f"  {model_name}: FAILED: {entry['error']}")
+
+    return entry
 
-            print(f"{n_q}/{total_q} questions, ${entry['cost_usd']:.4f}, {entry['time_seconds']:.1f}s")
 
-            # Add OCR metrics for hybrid models
-            if "+" in model_name and result.ocr_metrics is not None:
-                entry["ocr_metrics"] = result.ocr_metrics
+def benchmark_models(pdf_path: str, model_names: list = None,
+                     dpi: int = 200, images: list | None = None) -> list:
+    """Benchmark parsing models (vision + hybrid) on a single PDF.
+
+    Models run one at a time. Every MODEL_CONFIG entry is a MinerU hybrid
+    (provider "hybrid"), and MinerU is GPU-heavy, so there is no independent
+    provider to overlap with. Pass ``images`` (from render_pages) to reuse
+    already-rendered pages; otherwise the parser renders them on first use
+    (ExamParser.get_page_images), so MinerU-only runs never rasterize.
+    """
+    from src.config import MODEL_CONFIG
+    from src.parser import ExamParser
 
-        except Exception as e:
-            entry["error"] = f"{type(e).__name__}: {str(e)}"
-            print(f"FAILED: {entry['error']}")
+    if model_names is None:
+        model_names = list(MODEL_CONFIG.keys())
+    if not model_names:
+        return []
 
-        results.append(entry)
+    parser = ExamParser(pdf_path, dpi=dpi, page_images=images)
 
-    return results
+    return [
+        _bench_one_model(parser, model_name, MODEL_CONFIG.get(model_name, {}).get("provider", "unknown"))
+        for model_name in model_names
+    ]
 
 
 def generate_benchmark_report(
@@ -332,10 +375,13 @@ def main():
     print(f"Benchmarking with: {Path(pdf_path).name}")
     print(f"{'='*60}")
 
+    # Render pages once; both phases reuse the same images
+    images = render_pages(pdf_path, dpi=args.dpi)
+
     # Phase 1: OCR engines
     print("\nPhase 1: OCR Engine Benchmark")
     print("-" * 40)
-    ocr_results = benchmark_ocr_engines(pdf_path, dpi=args.dpi)
+    ocr_results = benchmark_ocr_engines(pdf_path, dpi=args.dpi, images=images)
     for r in ocr_results:
         status = "OK" if r["available"] and not r["error"] else r.get("error", "N/A")
         print(f"  {r['engine']:15s} | {status}")
@@ -345,7 +391,7 @@ def main():
     if not args.ocr_only:
         print("\nPhase 2: Model Parsing Benchmark")
         print("-" * 40)
-        model_results = benchmark_models(pdf_path, args.models, dpi=args.dpi)
+        model_results = benchmark_models(pdf_path, args.models, dpi=args.dpi, images=images)
 
     # Generate report
     generate_benchmark_report(
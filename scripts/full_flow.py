@@ -10,20 +10,30 @@ MinerU+LLM으로 PDF를 파싱하고 해설을 추가한 뒤 JSON + Markdown으
 """
 
 import argparse
-import json
+import multiprocessing
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
+from typing import NamedTuple
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from src.jsonio import BackgroundWriter, write_json
 from src.parser import ExamParser
+from src.result_cache import parse_with_cache
 from src.schema import ParsedExam, QuestionType
 
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
 from rich.table import Table
+from rich.text import Text
+
+try:
+    from src.explainer import add_explanations
+except ImportError:
+    add_explanations = None
 
 console = Console()
 
@@ -38,6 +48,18 @@ DEFAULT_PDFS = [
 # 선택지 원문자 (①②③④⑤)
 CIRCLE_NUMBERS = ["①", "②", "③", "④", "⑤"]
 
+# process_pdf가 PDF마다 찍는 고정 문구는 한 번만 마크업 파싱해 두고 Text.assemble로 조합
+# (동적 값은 마크업으로 해석되지 않으므로 에러 메시지의 '[' 등도 안전)
+_RULE = Text.from_markup(f"\n[bold]{'─'*60}[/bold]")
+_PDF = Text.from_markup("[bold magenta]PDF:[/bold magenta] ")
+_STEP1 = Text.from_markup("  [cyan]Step 1:[/cyan] Parsing with ")
+_STEP2 = Text.from_markup("  [cyan]Step 2:[/cyan] Generating explanations with ")
+_STEP2_SKIPPED = Text.from_markup("  [dim]Step 2: Skipped (--skip-explain)[/dim]")
+_STEP3 = Text.from_markup("  [cyan]Step 3:[/cyan] Saving JSON → ")
+_STEP4 = Text.from_markup("  [cyan]Step 4:[/cyan] Saving Markdown summary → ")
+_OK = Text.from_markup("    [green]✓[/green] ")
+_NO_EXPLAINER = Text.from_markup("    [yellow]⚠ src.explainer not available — skipping explanations[/yellow]")
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -81,6 +103,17 @@ Examples:
         default=200,
         help="DPI for PDF rendering (default: 200)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always re-parse instead of reusing cached results for the same PDF/model/DPI",
+    )
+    parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        default=1,
+        help="Number of PDFs to process in parallel processes (default: 1; each process loads its own MinerU model)",
+    )
     return parser.parse_args()
 
 
@@ -89,57 +122,113 @@ def is_listening(q) -> bool:
     return q.question_type == QuestionType.LISTENING
 
 
-def build_markdown_summary(parsed_exam: ParsedExam) -> str:
-    """ParsedExam으로부터 인간이 읽기 쉬운 Markdown 요약 생성"""
+# Markdown 요약의 고정 구간은 모듈 로드 시 한 번만 UTF-8로 인코딩해 두고,
+# 문제별로는 가변 필드만 인코딩해서 bytearray에 이어 붙인다 (str.format + 전체 encode 대신)
+_MD_Q_HEAD = b"## Question "
+_MD_Q_TYPE_OPEN = b" ["
+_MD_Q_POINTS_OPEN = b"] ("
+_MD_Q_TEXT = "점)\n\n**문제:** ".encode()
+_MD_PASSAGE = "**지문:** ".encode()
+_MD_CHOICES = "**선택지:**\n".encode()
+_MD_LISTENING = "**해설:** ⏭️ 듣기 문제 - 해설 생략\n".encode()
+_MD_EXPLANATION = "**해설:** ".encode()
+_MD_NO_EXPLANATION = "**해설:** (해설 없음)\n".encode()
+_MD_Q_END = b"\n---\n\n"
+_MD_BLANK = b"\n\n"
+_MD_CIRCLES = [f"{c} ".encode() for c in CIRCLE_NUMBERS]
+_MD_Q_TYPES = {qt: qt.value.encode() for qt in QuestionType}
+_MD_NO_Q_TYPE = "기타".encode()
+
+
+def build_markdown_summary(parsed_exam: ParsedExam) -> bytes:
+    """ParsedExam으로부터 인간이 읽기 쉬운 Markdown 요약 생성 (UTF-8 bytes)"""
     info = parsed_exam.exam_info
     questions = parsed_exam.questions
 
-    explained = [q for q in questions if not is_listening(q) and getattr(q, "explanation", None)]
-    skipped = [q for q in questions if is_listening(q)]
-
-    lines: list[str] = []
-    lines.append(f"# {info.title or '시험 문제'}")
-    lines.append("")
-    lines.append(f"- Year: {info.year}, Month: {info.month}, Grade: {info.grade}")
-    lines.append(f"- Subject: {info.subject or 'N/A'}")
-    lines.append(f"- Total Questions: {info.total_questions or len(questions)}")
-    lines.append(f"- Questions with Explanations: {len(explained)}")
-    lines.append(f"- Skipped (Listening/Audio): {len(skipped)}")
-    lines.append("")
-
-    for q in questions:
-        q_type = q.question_type.value if q.question_type else "기타"
-        lines.append(f"## Question {q.number} [{q_type}] ({q.points}점)")
-        lines.append("")
-        lines.append(f"**문제:** {q.question_text}")
-        lines.append("")
-
+    # 듣기 여부는 한 번만 계산해서 통계와 본문 루프에서 재사용
+    listening_flags = [q.question_type == QuestionType.LISTENING for q in questions]
+    n_skipped = sum(listening_flags)
+    n_explained = sum(
+        1 for q, listening in zip(questions, listening_flags)
+        if not listening and q.explanation
+    )
+    circles = _MD_CIRCLES
+    n_circle = len(circles)
+    q_types = _MD_Q_TYPES
+
+    ba = bytearray(
+        f"# {info.title or '시험 문제'}\n\n"
+        f"- Year: {info.year}, Month: {info.month}, Grade: {info.grade}\n"
+        f"- Subject: {info.subject or 'N/A'}\n"
+        f"- Total Questions: {info.total_questions or len(questions)}\n"
+        f"- Questions with Explanations: {n_explained}\n"
+        f"- Skipped (Listening/Audio): {n_skipped}\n\n".encode()
+    )
+    add = ba.extend
+
+    for q, listening in zip(questions, listening_flags):
+        add(_MD_Q_HEAD)
+        add(str(q.number).encode())
+        add(_MD_Q_TYPE_OPEN)
+        add(q_types.get(q.question_type, _MD_NO_Q_TYPE))
+        add(_MD_Q_POINTS_OPEN)
+        add(str(q.points).encode())
+        add(_MD_Q_TEXT)
+        add(q.question_text.encode())
+        add(_MD_BLANK)
         if q.passage:
-            lines.append(f"**지문:** {q.passage}")
-            lines.append("")
-
+            add(_MD_PASSAGE)
+            add(q.passage.encode())
+            add(_MD_BLANK)
         if q.choices:
-            lines.append("**선택지:**")
-            for choice in q.choices:
-                idx = choice.number - 1
-                symbol = CIRCLE_NUMBERS[idx] if 0 <= idx < len(CIRCLE_NUMBERS) else f"{choice.number}."
-                lines.append(f"{symbol} {choice.text}")
-            lines.append("")
-
-        if is_listening(q):
-            lines.append("**해설:** ⏭️ 듣기 문제 - 해설 생략")
+            add(_MD_CHOICES)
+            for c in q.choices:
+                idx = c.number - 1
+                add(circles[idx] if 0 <= idx < n_circle else f"{c.number}. ".encode())
+                add(c.text.encode())
+                add(b"\n")
+            add(b"\n")
+        if listening:
+            add(_MD_LISTENING)
+        elif q.explanation:
+            add(_MD_EXPLANATION)
+            add(q.explanation.encode())
+            add(b"\n")
         else:
-            explanation = getattr(q, "explanation", None)
-            if explanation:
-                lines.append(f"**해설:** {explanation}")
-            else:
-                lines.append("**해설:** (해설 없음)")
+            add(_MD_NO_EXPLANATION)
+        add(_MD_Q_END)
+
+    return bytes(ba)
+
+
+class ProcessSummary(NamedTuple):
+    """process_pdf의 PDF별 결과 요약 (run 메타데이터 저장 시에만 dict로 변환)"""
+
+    pdf: str
+    status: str
+    questions: int = 0
+    explained: int = 0
+    json_path: str | None = None
+    json_name: str | None = None
+    md_path: str | None = None
+    error: str | None = None
 
-        lines.append("")
-        lines.append("---")
-        lines.append("")
 
-    return "\n".join(lines)
+def _summary_record(summary: ProcessSummary) -> dict:
+    """run 메타데이터용 dict (json_name은 결과 표 전용이라 기존 스키마대로 제외)"""
+    record = summary._asdict()
+    del record["json_name"]
+    return record
+
+
+def _empty_summary(pdf_path: Path, status: str, error: str | None = None) -> ProcessSummary:
+    """파싱 전에 끝난 PDF의 결과 요약"""
+    return ProcessSummary(pdf=pdf_path.name, status=status, error=error)
+
+
+def _quiet_worker() -> None:
+    """Pool initializer: silence per-PDF output in worker processes (the parent owns the terminal)."""
+    console.quiet = True
 
 
 def process_pdf(
@@ -149,84 +238,97 @@ def process_pdf(
     output_dir: Path,
     skip_explain: bool,
     dpi: int,
-) -> dict:
-    """단일 PDF 처리: 파싱 → 해설 → 저장. 결과 요약 dict 반환."""
-    result = {
-        "pdf": pdf_path.name,
-        "status": "pending",
-        "questions": 0,
-        "explained": 0,
-        "json_path": None,
-        "md_path": None,
-        "error": None,
-    }
+    use_cache: bool = True,
+) -> ProcessSummary:
+    """단일 PDF 처리: 파싱 → 해설 → 저장. 결과 요약 ProcessSummary 반환.
+
+    워커 프로세스에서 실행될 수 있으므로 출력 파일은 PDF별 이름으로만 씁니다.
+    """
+    console.print(_RULE)
+    console.print(Text.assemble(_PDF, str(pdf_path)))
 
     # Step 1: Parse PDF
-    console.print(f"  [cyan]Step 1:[/cyan] Parsing with [bold]{model}[/bold]...")
+    console.print(Text.assemble(_STEP1, (model, "bold"), "..."))
     try:
         exam_parser = ExamParser(str(pdf_path), dpi=dpi)
-        parse_result = exam_parser.parse_with_model(model)
+        parse_result = parse_with_cache(exam_parser, model, use_cache=use_cache)
         parsed_exam = parse_result.parsed_exam
         n_q = len(parsed_exam.questions)
-        console.print(
-            f"    [green]✓[/green] Parsed {n_q} questions "
-            f"(${parse_result.total_cost_usd:.4f}, {parse_result.parsing_time_seconds:.1f}s)"
-        )
-        result["questions"] = n_q
+        console.print(Text.assemble(
+            _OK,
+            f"Parsed {n_q} questions (${parse_result.total_cost_usd:.4f}, "
+            + ("cached)" if parse_result.cached else f"{parse_result.parsing_time_seconds:.1f}s)"),
+        ))
     except Exception as e:
-        result["status"] = "parse_failed"
-        result["error"] = f"Parse error: {e}"
-        console.print(f"    [red]✗ Parse failed:[/red] {e}")
-        return result
+        console.print(Text.assemble(("    ✗ Parse failed:", "red"), f" {e}"))
+        return _empty_summary(pdf_path, "parse_failed", f"Parse error: {e}")
 
     # Step 2: Add explanations
+    explained_count = 0
     if not skip_explain:
-        console.print(f"  [cyan]Step 2:[/cyan] Generating explanations with [bold]{llm}[/bold]...")
-        try:
-            from src.explainer import add_explanations
-            parsed_exam = add_explanations(parsed_exam, llm_name=llm)
-            explained_count = sum(
-                1 for q in parsed_exam.questions
-                if not is_listening(q) and getattr(q, "explanation", None)
-            )
-            console.print(f"    [green]✓[/green] Explanations added to {explained_count} questions")
-            result["explained"] = explained_count
-        except ImportError:
-            console.print("    [yellow]⚠ src.explainer not available — skipping explanations[/yellow]")
-        except Exception as e:
-            console.print(f"    [yellow]⚠ Explanation error:[/yellow] {e} — saving without explanations")
+        console.print(Text.assemble(_STEP2, (llm, "bold"), "..."))
+        if add_explanations is None:
+            console.print(_NO_EXPLAINER)
+        else:
+            try:
+                parsed_exam = add_explanations(parsed_exam, llm_name=llm)
+                listening_type = QuestionType.LISTENING
+                explained_count = sum(
+                    1 for q in parsed_exam.questions
+                    if q.question_type is not listening_type and q.explanation
+                )
+                console.print(Text.assemble(_OK, f"Explanations added to {explained_count} questions"))
+            except Exception as e:
+                console.print(Text.assemble(
+                    ("    ⚠ Explanation error:", "yellow"), f" {e} — saving without explanations"
+                ))
     else:
-        console.print("  [dim]Step 2: Skipped (--skip-explain)[/dim]")
+        console.print(_STEP2_SKIPPED)
 
-    # Step 3: Save JSON
+    # Step 3 + 4: Save JSON and Markdown summary (written concurrently, checked together)
     pdf_stem = pdf_path.stem
     json_path = output_dir / f"{pdf_stem}.json"
-    console.print(f"  [cyan]Step 3:[/cyan] Saving JSON → {json_path.name}")
-    try:
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(parsed_exam.model_dump(), f, ensure_ascii=False, indent=2)
-        result["json_path"] = str(json_path)
-        console.print(f"    [green]✓[/green] JSON saved")
-    except Exception as e:
-        console.print(f"    [red]✗ JSON save failed:[/red] {e}")
-
-    # Step 4: Save Markdown summary
     md_path = output_dir / f"{pdf_stem}_summary.md"
-    console.print(f"  [cyan]Step 4:[/cyan] Saving Markdown summary → {md_path.name}")
-    try:
-        md_content = build_markdown_summary(parsed_exam)
-        with open(md_path, "w", encoding="utf-8") as f:
-            f.write(md_content)
-        result["md_path"] = str(md_path)
-        console.print(f"    [green]✓[/green] Markdown saved")
-    except Exception as e:
-        console.print(f"    [red]✗ Markdown save failed:[/red] {e}")
+    saved: dict[str, str] = {}
+    submitted: list[tuple[str, Path, str]] = []
+    # Re-runs served from the result cache produce identical files; don't rewrite them
+    with BackgroundWriter(skip_unchanged=True) as writer:
+        console.print(Text.assemble(_STEP3, json_path.name))
+        try:
+            # pydantic-core serializes straight to JSON (no intermediate model_dump() dict)
+            writer.submit(json_path, parsed_exam.model_dump_json(indent=2).encode("utf-8"))
+            submitted.append(("json_path", json_path, "JSON"))
+        except Exception as e:
+            console.print(Text.assemble(("    ✗ JSON save failed:", "red"), f" {e}"))
 
-    result["status"] = "success"
-    return result
+        console.print(Text.assemble(_STEP4, md_path.name))
+        try:
+            writer.submit(md_path, build_markdown_summary(parsed_exam))
+            submitted.append(("md_path", md_path, "Markdown"))
+        except Exception as e:
+            console.print(Text.assemble(("    ✗ Markdown save failed:", "red"), f" {e}"))
+
+        errors = writer.drain()
+
+    for key, path, label in submitted:
+        if path in errors:
+            console.print(Text.assemble((f"    ✗ {label} save failed:", "red"), f" {errors[path]}"))
+        else:
+            saved[key] = str(path)
+            console.print(Text.assemble(_OK, f"{label} saved"))
+
+    return ProcessSummary(
+        pdf=pdf_path.name,
+        status="success",
+        questions=n_q,
+        explained=explained_count,
+        json_path=saved.get("json_path"),
+        json_name=json_path.name if "json_path" in saved else None,
+        md_path=saved.get("md_path"),
+    )
 
 
-def print_final_table(summaries: list[dict]) -> None:
+def print_final_table(summaries: list[ProcessSummary]) -> None:
     """최종 처리 결과 Rich 테이블 출력"""
     table = Table(title="Full Flow Summary", show_lines=True)
     table.add_column("PDF", style="cyan", no_wrap=False)
@@ -236,15 +338,15 @@ def print_final_table(summaries: list[dict]) -> None:
     table.add_column("Output", style="dim")
 
     for s in summaries:
-        status_str = "[green]✓ OK[/green]" if s["status"] == "success" else f"[red]✗ {s['status']}[/red]"
-        q_str = str(s["questions"]) if s["questions"] else "-"
-        ex_str = str(s["explained"]) if s["explained"] else "-"
+        status_str = "[green]✓ OK[/green]" if s.status == "success" else f"[red]✗ {s.status}[/red]"
+        q_str = str(s.questions) if s.questions else "-"
+        ex_str = str(s.explained) if s.explained else "-"
         out = ""
-        if s["json_path"]:
-            out = Path(s["json_path"]).name
-        elif s["error"]:
-            out = s["error"][:50]
-        table.add_row(s["pdf"], status_str, q_str, ex_str, out)
+        if s.json_name:
+            out = s.json_name
+        elif s.error:
+            out = s.error[:50]
+        table.add_row(s.pdf, status_str, q_str, ex_str, out)
 
     console.print(table)
 
@@ -266,7 +368,16 @@ def main():
         border_style="blue",
     ))
 
-    summaries: list[dict] = []
+    process_kwargs = {
+        "model": args.model,
+        "llm": args.llm,
+        "output_dir": output_dir,
+        "skip_explain": args.skip_explain,
+        "dpi": args.dpi,
+        "use_cache": not args.no_cache,
+    }
+    # 입력 순서대로 요약을 보관 (병렬 실행 시 완료 순서와 무관)
+    summaries: list[ProcessSummary | None] = [None] * len(pdf_paths)
 
     with Progress(
         SpinnerColumn(),
@@ -279,55 +390,57 @@ def main():
     ) as progress:
         overall = progress.add_task("Processing PDFs...", total=len(pdf_paths))
 
-        for pdf_path in pdf_paths:
-            progress.update(overall, description=f"[cyan]{pdf_path.name}[/cyan]")
-            console.print(f"\n[bold]{'─'*60}[/bold]")
-            console.print(f"[bold magenta]PDF:[/bold magenta] {pdf_path}")
-
+        pending: list[tuple[int, Path]] = []
+        for idx, pdf_path in enumerate(pdf_paths):
             if not pdf_path.exists():
+                console.print(_RULE)
+                console.print(Text.assemble(_PDF, str(pdf_path)))
                 console.print(f"  [red]✗ File not found:[/red] {pdf_path}")
-                summaries.append({
-                    "pdf": pdf_path.name,
-                    "status": "not_found",
-                    "questions": 0,
-                    "explained": 0,
-                    "json_path": None,
-                    "md_path": None,
-                    "error": "File not found",
-                })
+                summaries[idx] = _empty_summary(pdf_path, "not_found", "File not found")
                 progress.advance(overall)
-                continue
-
-            summary = process_pdf(
-                pdf_path=pdf_path,
-                model=args.model,
-                llm=args.llm,
-                output_dir=output_dir,
-                skip_explain=args.skip_explain,
-                dpi=args.dpi,
-            )
-            summaries.append(summary)
-            progress.advance(overall)
+            else:
+                pending.append((idx, pdf_path))
+
+        # PDF끼리는 독립적이라 --workers로 프로세스 병렬 처리 가능 (opt-in): 프로세스마다 MinerU 모델을
+        # 따로 올려 GPU 메모리(4GB+)를 차지하므로 기본값은 1. spawn으로 띄워 rich Progress 스레드가 도는
+        # 부모를 fork하지 않고, 워커 출력은 끄고 부모의 진행 표시/최종 표만 남깁니다.
+        workers = min(max(1, args.workers), len(pending))
+        if workers <= 1:
+            for idx, pdf_path in pending:
+                progress.update(overall, description=f"[cyan]{pdf_path.name}[/cyan]")
+                summaries[idx] = process_pdf(pdf_path=pdf_path, **process_kwargs)
+                progress.advance(overall)
+        else:
+            progress.update(overall, description=f"[cyan]Processing with {workers} workers[/cyan]")
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn"), initializer=_quiet_worker,
+            ) as executor:
+                futures = {
+                    executor.submit(process_pdf, pdf_path=pdf_path, **process_kwargs): (idx, pdf_path)
+                    for idx, pdf_path in pending
+                }
+                for future in as_completed(futures):
+                    idx, pdf_path = futures[future]
+                    try:
+                        summaries[idx] = future.result()
+                    except Exception as e:  # worker crash (e.g. BrokenProcessPool)
+                        console.print(f"  [red]✗ Worker failed:[/red] {pdf_path.name}: {e}")
+                        summaries[idx] = _empty_summary(pdf_path, "worker_failed", f"Worker error: {e}")
+                    progress.advance(overall)
 
     console.print(f"\n[bold]{'─'*60}[/bold]")
     print_final_table(summaries)
 
     # Save run metadata
     meta_path = output_dir / f"run_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    with open(meta_path, "w", encoding="utf-8") as f:
-        json.dump(
-            {
-                "model": args.model,
-                "llm": args.llm,
-                "skip_explain": args.skip_explain,
-                "dpi": args.dpi,
-                "pdfs_processed": len(summaries),
-                "results": summaries,
-            },
-            f,
-            ensure_ascii=False,
-            indent=2,
-        )
+    write_json(meta_path, {
+        "model": args.model,
+        "llm": args.llm,
+        "skip_explain": args.skip_explain,
+        "dpi": args.dpi,
+        "pdfs_processed": len(summaries),
+        "results": [_summary_record(s) for s in summaries],
+    })
     console.print(f"\n[green]Run metadata saved to:[/green] {meta_path}")
 
 
@@ -12,20 +12,34 @@ Model Comparison Runner - 모델별 파싱 결과 비교 및 리포트 생성
 """
 
 import argparse
-import json
+import asyncio
+import io
 import sys
 import time
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
 
 from src.config import sanitize_model_name
+from src.jsonio import write_bytes, write_json
+from src.result_cache import parse_with_cache
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
 from rich.table import Table
+from rich.text import Text
+
+try:
+    from src.evaluator import evaluate, parse_answer_md
+except ImportError:
+    evaluate = parse_answer_md = None
 
 console = Console()
 
+# Per-model status prefixes, markup-parsed once; dynamic parts are appended as plain Text
+_OK = Text.from_markup("  [green]OK[/green] ")
+_FAILED = Text.from_markup("  [red]FAILED[/red] ")
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -69,37 +83,65 @@ Examples:
         action="store_true",
         help="Include hybrid OCR+LLM models"
     )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=1,
+        help="Maximum number of models parsed at the same time (default: 1). Each hybrid model runs its "
+             "own MinerU analysis of the PDF in this process, so raise it only with GPU memory to spare"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always re-parse instead of reusing cached results for the same PDF/model/DPI"
+    )
+    parser.add_argument(
+        "--no-report",
+        action="store_true",
+        help="Skip the Markdown report (JSON results and summary only)"
+    )
+    parser.add_argument(
+        "--detailed",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Include per-question details and hard questions in the report (default: on)"
+    )
     return parser.parse_args()
 
 
 def load_answer_key(answer_path: str):
     """Load and parse answer key from Markdown file. Returns None if not available."""
+    if parse_answer_md is None:
+        console.print("[yellow]Warning: src.evaluator not available — skipping accuracy evaluation[/yellow]")
+        return None
     try:
-        from src.evaluator import parse_answer_md
         answer_key = parse_answer_md(answer_path)
         console.print(f"[green]Loaded answer key from {answer_path}[/green]")
         return answer_key
-    except ImportError:
-        console.print("[yellow]Warning: src.evaluator not available — skipping accuracy evaluation[/yellow]")
-        return None
     except Exception as e:
         console.print(f"[yellow]Warning: could not load answer key: {e}[/yellow]")
         return None
 
 
-def run_model(parser, model_name: str) -> dict:
-    """Run a single model and return result dict with timing info."""
+def run_model(parser, model_name: str, use_cache: bool = True) -> dict:
+    """Run a single model and return result dict with timing info.
+
+    Results are served from the on-disk cache when the same PDF/model/DPI was
+    parsed before, unless ``use_cache`` is False.
+    """
     entry = {
         "model": model_name,
         "result": None,
         "eval": None,
         "error": None,
         "time_seconds": 0.0,
+        "cached": False,
     }
     start = time.time()
     try:
-        result = parser.parse_with_model(model_name)
+        result = parse_with_cache(parser, model_name, use_cache=use_cache)
         entry["result"] = result
+        entry["cached"] = result.cached
         entry["time_seconds"] = round(time.time() - start, 2)
     except Exception as e:
         entry["error"] = f"{type(e).__name__}: {e}"
@@ -107,12 +149,49 @@ def run_model(parser, model_name: str) -> dict:
     return entry
 
 
+async def run_models_async(
+    parser, model_names: list[str], max_concurrency: int, on_done=None, use_cache: bool = True,
+    finish=None,
+) -> list[dict]:
+    """Run models concurrently in worker threads and return entries in model_names order.
+
+    Each parse is a blocking MinerU pass plus a multi-second LLM round-trip. The
+    semaphore bounds how many run at once; with max_concurrency=1 (the CLI
+    default) models run one after another. ``finish(entry)`` does the blocking follow-up
+    work for a successful parse (saving, evaluation) in a worker thread; if it
+    raises, the error is recorded on the entry so it shows up in the report.
+    ``on_done(entry)`` is then called on the event loop for progress output.
+    """
+    sem = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def run_one(model_name: str) -> dict:
+        async with sem:
+            entry = await asyncio.to_thread(run_model, parser, model_name, use_cache)
+        if finish is not None and not entry["error"]:
+            try:
+                await asyncio.to_thread(finish, entry)
+            except Exception as e:
+                entry["error"] = f"{type(e).__name__}: {e}"
+        if on_done is not None:
+            on_done(entry)
+        return entry
+
+    tasks = [asyncio.create_task(run_one(m)) for m in model_names]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    entries = []
+    for model_name, res in zip(model_names, results):
+        if isinstance(res, BaseException):
+            res = {"model": model_name, "result": None, "eval": None,
+                   "error": f"{type(res).__name__}: {res}", "time_seconds": 0.0}
+        entries.append(res)
+    return entries
+
+
 def evaluate_result(result, answer_key) -> dict | None:
     """Evaluate a ParseResult against an AnswerKey. Returns eval dict or None."""
-    if answer_key is None or result is None:
+    if answer_key is None or result is None or evaluate is None:
         return None
     try:
-        from src.evaluator import evaluate
         eval_result = evaluate(result.parsed_exam, answer_key, model_name=result.model_name)
         # Convert EvalResult Pydantic model to the dict format expected by report generation
         per_question_dict = {
@@ -138,8 +217,6 @@ def evaluate_result(result, answer_key) -> dict | None:
             "total_questions_found": eval_result.total_questions_found,
             "per_question": per_question_dict,
         }
-    except ImportError:
-        return None
     except Exception as e:
         console.print(f"[yellow]  Evaluation error: {e}[/yellow]")
         return None
@@ -149,206 +226,226 @@ def save_result_json(result, output_dir: Path, model_name: str) -> Path:
     """Save ParseResult to JSON file."""
     safe_name = sanitize_model_name(model_name)
     out_path = output_dir / f"{safe_name}_result.json"
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(result.model_dump(), f, ensure_ascii=False, indent=2)
+    # pydantic-core serializes straight to JSON (no intermediate model_dump() dict)
+    write_bytes(out_path, result.model_dump_json(indent=2).encode("utf-8"))
     return out_path
 
 
+def _write_report_header(w, pdf_name: str, answer_name: str | None, n_models: int) -> None:
+    """Title block shared by the streamed partial report and the final report."""
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    w("# Exam Parser Model Comparison Report\n\n")
+    w(f"- **Date**: {now}\n")
+    w(f"- **PDF**: `{pdf_name}`\n")
+    if answer_name:
+        w(f"- **Answer Key**: `{answer_name}`\n")
+    w(f"- **Models Tested**: {n_models}\n\n")
+
+
+def _summary_table_header(has_eval: bool) -> str:
+    if has_eval:
+        return (
+            "| Model | Questions | Coverage | Passage Acc | Choice Acc | Overall | Cost | Time |\n"
+            "|-------|-----------|----------|-------------|------------|---------|------|------|\n"
+        )
+    return "| Model | Questions | Coverage | Cost | Time |\n|-------|-----------|----------|------|------|\n"
+
+
+def _time_label(e: dict) -> str:
+    """Run time for display; cache hits say so instead of showing a load time."""
+    return "cached" if e.get("cached") else f"{e['time_seconds']:.1f}s"
+
+
+def _summary_row(e: dict, has_eval: bool) -> str:
+    """One summary table row for a model entry (failed runs get dashes)."""
+    model = e["model"]
+    if e["error"]:
+        if has_eval:
+            return f"| {model} | - | - | - | - | - | - | - |\n"
+        return f"| {model} | - | - | - | - |\n"
+
+    r = e["result"]
+    n_q = len(r.parsed_exam.questions)
+    total_q = r.parsed_exam.exam_info.total_questions or n_q
+    coverage = f"{round(n_q / total_q * 100, 1)}%" if total_q > 0 else "N/A"
+    cost = f"${r.total_cost_usd:.4f}"
+    t = _time_label(e)
+
+    ev = e["eval"]
+    if has_eval and ev:
+        passage_acc = f"{ev.get('passage_accuracy_pct', 0):.1f}%"
+        choice_acc = f"{ev.get('choice_accuracy_pct', 0):.1f}%"
+        overall = f"{ev.get('overall_accuracy_pct', 0):.1f}%"
+        return (
+            f"| {model} | {n_q}/{total_q} | {coverage} | {passage_acc} | {choice_acc} | {overall} "
+            f"| {cost} | {t} |\n"
+        )
+    return f"| {model} | {n_q}/{total_q} | {coverage} | {cost} | {t} |\n"
+
+
+class PartialReport:
+    """Keeps ``report.md`` current while models are still running.
+
+    The title block and summary table header are written up front and each
+    finished model appends its row, so a slow or interrupted run still leaves a
+    readable report behind. The complete report replaces it once all models finish.
+    """
+
+    def __init__(self, path: Path, pdf_name: str, answer_name: str | None, n_models: int, has_eval: bool):
+        self._has_eval = has_eval
+        self._f = open(path, "w", encoding="utf-8")
+        _write_report_header(self._f.write, pdf_name, answer_name, n_models)
+        self._f.write("## Summary (in progress)\n\n")
+        self._f.write(_summary_table_header(has_eval))
+        self._f.flush()
+
+    def add(self, entry: dict) -> None:
+        self._f.write(_summary_row(entry, self._has_eval))
+        self._f.flush()
+
+    def close(self) -> None:
+        self._f.close()
+
+    def __enter__(self) -> "PartialReport":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
 def generate_markdown_report(
     entries: list[dict],
-    pdf_path: str,
-    answer_path: str | None,
+    pdf_name: str,
+    answer_name: str | None,
     output_dir: Path,
+    detailed: bool = True,
 ) -> str:
-    """Generate a Markdown comparison report from model run entries."""
-    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    pdf_name = Path(pdf_path).name
+    """Generate a Markdown comparison report from model run entries.
+
+    Takes file names rather than paths so report building does no path parsing.
+    With ``detailed=False`` the per-question sections are left out and the
+    per-question matrix is never built.
+    """
     has_eval = any(e["eval"] is not None for e in entries)
 
-    lines = []
-    lines.append("# Exam Parser Model Comparison Report")
-    lines.append("")
-    lines.append(f"- **Date**: {now}")
-    lines.append(f"- **PDF**: `{pdf_name}`")
-    if answer_path:
-        lines.append(f"- **Answer Key**: `{Path(answer_path).name}`")
-    lines.append(f"- **Models Tested**: {len(entries)}")
-    lines.append("")
+    buf = io.StringIO()
+    w = buf.write
+    _write_report_header(w, pdf_name, answer_name, len(entries))
 
     # --- Summary Table ---
-    lines.append("## Summary")
-    lines.append("")
-    if has_eval:
-        lines.append(
-            "| Model | Questions | Coverage | Passage Acc | Choice Acc | Overall | Cost | Time |"
-        )
-        lines.append(
-            "|-------|-----------|----------|-------------|------------|---------|------|------|"
-        )
-    else:
-        lines.append("| Model | Questions | Coverage | Cost | Time |")
-        lines.append("|-------|-----------|----------|------|------|")
+    w("## Summary\n\n")
+    w(_summary_table_header(has_eval))
 
     successful = []
     for e in entries:
-        model = e["model"]
-        if e["error"]:
-            if has_eval:
-                lines.append(f"| {model} | - | - | - | - | - | - | - |")
-            else:
-                lines.append(f"| {model} | - | - | - | - |")
-            continue
-
+        w(_summary_row(e, has_eval))
+        if not e["error"]:
+            successful.append(e)
+
+    w("\n")
+
+    # One pass over successful runs: ranking winners (first wins on ties, like a stable
+    # sort), the set of question numbers, and a per-question found matrix.
+    best_acc = best_cov = best_cost = best_speed = best_eff = None
+    best_acc_val = best_cov_n = best_cost_val = best_speed_val = best_eff_val = 0.0
+    eval_models = []
+    all_q_nums: set[int] = set()
+    for e in successful:
         r = e["result"]
         n_q = len(r.parsed_exam.questions)
-        total_q = r.parsed_exam.exam_info.total_questions or n_q
-        coverage = f"{round(n_q / total_q * 100, 1)}%" if total_q > 0 else "N/A"
-        cost = f"${r.total_cost_usd:.4f}"
-        t = f"{e['time_seconds']:.1f}s"
-
+        cost = r.total_cost_usd
         ev = e["eval"]
         if has_eval and ev:
-            passage_acc = f"{ev.get('passage_accuracy_pct', 0):.1f}%"
-            choice_acc = f"{ev.get('choice_accuracy_pct', 0):.1f}%"
-            overall = f"{ev.get('overall_accuracy_pct', 0):.1f}%"
-            lines.append(
-                f"| {model} | {n_q}/{total_q} | {coverage} | {passage_acc} | {choice_acc} | {overall} | {cost} | {t} |"
-            )
-        else:
-            lines.append(f"| {model} | {n_q}/{total_q} | {coverage} | {cost} | {t} |")
-
-        successful.append(e)
-
-    lines.append("")
+            acc = ev.get("overall_accuracy_pct", 0)
+            if best_acc is None or acc > best_acc_val:
+                best_acc, best_acc_val = e, acc
+        if best_cov is None or n_q > best_cov_n:
+            best_cov, best_cov_n = e, n_q
+        if best_cost is None or cost < best_cost_val:
+            best_cost, best_cost_val = e, cost
+        # Cache hits took no parse time this run, so they don't compete for Fastest
+        if not e.get("cached") and (best_speed is None or e["time_seconds"] < best_speed_val):
+            best_speed, best_speed_val = e, e["time_seconds"]
+        eff = cost / n_q if n_q > 0 else float("inf")
+        if best_eff is None or eff < best_eff_val:
+            best_eff, best_eff_val = e, eff
+        if detailed and ev and "per_question" in ev:
+            eval_models.append(e)
+            all_q_nums.update(int(q_num) for q_num in ev["per_question"])
+
+    found_matrix: dict[int, list[bool]] = {
+        q_num: [e["eval"]["per_question"].get(str(q_num), {}).get("found", False) for e in eval_models]
+        for q_num in sorted(all_q_nums)
+    } if has_eval and detailed else {}
 
     # --- Rankings ---
     if successful:
-        lines.append("## Rankings")
-        lines.append("")
-
-        if has_eval:
-            by_accuracy = sorted(
-                [e for e in successful if e["eval"]],
-                key=lambda x: x["eval"].get("overall_accuracy_pct", 0),
-                reverse=True,
-            )
-            if by_accuracy:
-                best = by_accuracy[0]
-                acc = best["eval"].get("overall_accuracy_pct", 0)
-                lines.append(f"- **Best Accuracy**: {best['model']} ({acc:.1f}%)")
-
-        by_coverage = sorted(
-            successful,
-            key=lambda x: len(x["result"].parsed_exam.questions),
-            reverse=True,
-        )
-        by_cost = sorted(successful, key=lambda x: x["result"].total_cost_usd)
-        by_speed = sorted(successful, key=lambda x: x["time_seconds"])
-
-        if by_coverage:
-            b = by_coverage[0]
-            n_q = len(b["result"].parsed_exam.questions)
-            total_q = b["result"].parsed_exam.exam_info.total_questions or n_q
-            lines.append(f"- **Best Coverage**: {b['model']} ({n_q}/{total_q})")
+        w("## Rankings\n\n")
 
-        if by_cost:
-            b = by_cost[0]
-            lines.append(f"- **Lowest Cost**: {b['model']} (${b['result'].total_cost_usd:.4f})")
+        if best_acc is not None:
+            w(f"- **Best Accuracy**: {best_acc['model']} ({best_acc_val:.1f}%)\n")
 
-        if by_speed:
-            b = by_speed[0]
-            lines.append(f"- **Fastest**: {b['model']} ({b['time_seconds']:.1f}s)")
+        total_q = best_cov["result"].parsed_exam.exam_info.total_questions or best_cov_n
+        w(f"- **Best Coverage**: {best_cov['model']} ({best_cov_n}/{total_q})\n")
+        w(f"- **Lowest Cost**: {best_cost['model']} (${best_cost_val:.4f})\n")
+        if best_speed is not None:
+            w(f"- **Fastest**: {best_speed['model']} ({best_speed_val:.1f}s)\n")
+        w(f"- **Best Cost-Efficiency**: {best_eff['model']} (${best_eff_val:.4f}/q)\n")
 
-        # Cost efficiency
-        def cost_per_q(e):
-            n = len(e["result"].parsed_exam.questions)
-            return e["result"].total_cost_usd / n if n > 0 else float("inf")
-
-        by_efficiency = sorted(successful, key=cost_per_q)
-        if by_efficiency:
-            b = by_efficiency[0]
-            lines.append(f"- **Best Cost-Efficiency**: {b['model']} (${cost_per_q(b):.4f}/q)")
-
-        lines.append("")
+        w("\n")
 
     # --- Per-Question Details ---
-    if has_eval and successful:
-        lines.append("## Per-Question Details")
-        lines.append("")
+    if has_eval and successful and detailed:
+        w("## Per-Question Details\n\n")
 
-        eval_models = [e for e in successful if e["eval"] and "per_question" in e["eval"]]
         if eval_models:
             header_models = [e["model"] for e in eval_models]
             header = "| Q# | " + " | ".join(header_models) + " |"
             sep = "|----|-" + "-|-".join(["------"] * len(eval_models)) + "-|"
-            lines.append(header)
-            lines.append(sep)
-
-            # Collect all question numbers
-            all_q_nums = set()
-            for e in eval_models:
-                for q_num in e["eval"]["per_question"].keys():
-                    all_q_nums.add(int(q_num))
-
-            for q_num in sorted(all_q_nums):
-                row = f"| {q_num} |"
-                for e in eval_models:
-                    pq = e["eval"]["per_question"].get(str(q_num), {})
-                    found = pq.get("found", False)
+            w(f"{header}\n{sep}\n")
+
+            per_question = [e["eval"]["per_question"] for e in eval_models]
+            for q_num in found_matrix:
+                key = str(q_num)
+                cells = [str(q_num)]
+                for pq_by_num in per_question:
+                    pq = pq_by_num.get(key, {})
                     sim = pq.get("similarity", None)
-                    if not found:
-                        cell = "missing"
+                    if not pq.get("found", False):
+                        cells.append("missing")
                     elif sim is not None:
-                        cell = f"{sim:.2f}"
+                        cells.append(f"{sim:.2f}")
                     else:
-                        cell = "found"
-                    row += f" {cell} |"
-                lines.append(row)
+                        cells.append("found")
+                # one join per row instead of a += copy per cell
+                w(f"| {' | '.join(cells)} |\n")
 
-            lines.append("")
+            w("\n")
 
     # --- Hard Questions ---
-    if has_eval and successful:
-        eval_models = [e for e in successful if e["eval"] and "per_question" in e["eval"]]
-        if eval_models:
-            all_q_nums = set()
-            for e in eval_models:
-                for q_num in e["eval"]["per_question"].keys():
-                    all_q_nums.add(int(q_num))
-
-            missed_by_all = []
-            for q_num in sorted(all_q_nums):
-                missed_all = all(
-                    not e["eval"]["per_question"].get(str(q_num), {}).get("found", False)
-                    for e in eval_models
-                )
-                if missed_all:
-                    missed_by_all.append(q_num)
-
-            lines.append("## Hard Questions")
-            lines.append("")
-            if missed_by_all:
-                lines.append(f"Questions missed by **all** models: {', '.join(str(q) for q in missed_by_all)}")
-            else:
-                lines.append("No questions were missed by all models.")
-            lines.append("")
+    if has_eval and successful and eval_models:
+        missed_by_all = [q_num for q_num, found in found_matrix.items() if not any(found)]
+
+        w("## Hard Questions\n\n")
+        if missed_by_all:
+            w(f"Questions missed by **all** models: {', '.join(str(q) for q in missed_by_all)}\n")
+        else:
+            w("No questions were missed by all models.\n")
+        w("\n")
 
     # --- Errors ---
     failed = [e for e in entries if e["error"]]
     if failed:
-        lines.append("## Errors")
-        lines.append("")
+        w("## Errors\n\n")
         for e in failed:
-            lines.append(f"- **{e['model']}**: `{e['error']}`")
-        lines.append("")
+            w(f"- **{e['model']}**: `{e['error']}`\n")
+        w("\n")
 
     # --- Output files ---
-    lines.append("## Output Files")
-    lines.append("")
-    lines.append(f"Results saved to: `{output_dir}/`")
-    lines.append("")
+    w("## Output Files\n\n")
+    w(f"Results saved to: `{output_dir}/`\n\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def print_summary_table(entries: list[dict], has_eval: bool) -> None:
@@ -372,7 +469,7 @@ def print_summary_table(entries: list[dict], has_eval: bool) -> None:
         n_q = len(r.parsed_exam.questions)
         total_q = r.parsed_exam.exam_info.total_questions or n_q
         cost = f"${r.total_cost_usd:.4f}"
-        t = f"{e['time_seconds']:.1f}s"
+        t = _time_label(e)
         status = "[green]OK[/green]"
 
         if has_eval and e["eval"]:
@@ -399,8 +496,10 @@ def main():
     output_dir = Path(args.output)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    report_path = Path(args.report) if args.report else output_dir / "report.md"
-    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path = None
+    if not args.no_report:
+        report_path = Path(args.report) if args.report else output_dir / "report.md"
+        report_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Determine models
     from src.parser import ExamParser, HYBRID_MODELS
@@ -414,7 +513,7 @@ def main():
         f"[bold]PDF:[/bold] {pdf_path.name}\n"
         f"[bold]Models:[/bold] {', '.join(model_names)}\n"
         f"[bold]Output:[/bold] {output_dir}\n"
-        f"[bold]Report:[/bold] {report_path}",
+        f"[bold]Report:[/bold] {report_path or 'disabled'}",
         title="Exam Parser Comparison",
         border_style="blue",
     ))
@@ -427,57 +526,69 @@ def main():
     # Initialize parser
     exam_parser = ExamParser(str(pdf_path), dpi=args.dpi)
 
-    # Run each model
-    entries = []
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TextColumn("{task.completed}/{task.total}"),
-        TimeElapsedColumn(),
-        console=console,
-    ) as progress:
+    # Rows land in report.md as models finish; saving and evaluation run off the event loop
+    answer_name = Path(args.answer).name if args.answer else None
+    expect_eval = answer_key is not None and evaluate is not None
+    with (
+        (
+            PartialReport(report_path, pdf_path.name, answer_name, len(model_names), expect_eval)
+            if report_path else nullcontext()
+        ) as partial,
+        Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TextColumn("{task.completed}/{task.total}"),
+            TimeElapsedColumn(),
+            console=console,
+        ) as progress,
+    ):
         task = progress.add_task("Running models...", total=len(model_names))
 
-        for model_name in model_names:
-            progress.update(task, description=f"[cyan]{model_name}[/cyan]")
-            entry = run_model(exam_parser, model_name)
+        def finish_model(entry: dict) -> None:
+            # Save individual JSON result, then evaluate against answer key
+            entry["json_path"] = save_result_json(entry["result"], output_dir, entry["model"])
+            entry["eval"] = evaluate_result(entry["result"], answer_key)
 
+        def on_model_done(entry: dict) -> None:
+            model_name = entry["model"]
             if entry["error"]:
-                console.print(f"  [red]FAILED[/red] {model_name}: {entry['error']}")
+                console.print(Text.assemble(_FAILED, f"{model_name}: {entry['error']}"))
             else:
                 r = entry["result"]
                 n_q = len(r.parsed_exam.questions)
                 total_q = r.parsed_exam.exam_info.total_questions or n_q
-                console.print(
-                    f"  [green]OK[/green] {model_name}: {n_q}/{total_q} questions, "
-                    f"${r.total_cost_usd:.4f}, {entry['time_seconds']:.1f}s"
-                )
-
-                # Save individual JSON result
-                json_path = save_result_json(r, output_dir, model_name)
-                console.print(f"     Saved: {json_path}")
-
-                # Evaluate against answer key
-                entry["eval"] = evaluate_result(r, answer_key)
+                console.print(Text.assemble(
+                    _OK,
+                    f"{model_name}: {n_q}/{total_q} questions, ${r.total_cost_usd:.4f}, {_time_label(entry)}",
+                ))
+                console.print(f"  {model_name}: saved {entry['json_path']}")
                 if entry["eval"]:
                     acc = entry["eval"].get("overall_accuracy_pct", 0)
                     console.print(f"     Accuracy: {acc:.1f}%")
 
-            entries.append(entry)
+            if partial is not None:
+                partial.add(entry)
+            progress.update(task, description=f"[cyan]{model_name}[/cyan]")
             progress.advance(task)
 
+        entries = asyncio.run(run_models_async(
+            exam_parser, model_names, args.max_concurrency, on_model_done, use_cache=not args.no_cache,
+            finish=finish_model,
+        ))
+
     # Print summary
     has_eval = any(e["eval"] is not None for e in entries)
     console.print("")
     print_summary_table(entries, has_eval)
 
     # Generate Markdown report
-    report_md = generate_markdown_report(entries, str(pdf_path), args.answer, output_dir)
-    with open(report_path, "w", encoding="utf-8") as f:
-        f.write(report_md)
-
-    console.print(f"\n[green]Report saved to:[/green] {report_path}")
+    if report_path:
+        report_md = generate_markdown_report(
+            entries, pdf_path.name, answer_name, output_dir, detailed=args.detailed,
+        )
+        write_bytes(report_path, report_md.encode("utf-8"))
+        console.print(f"\n[green]Report saved to:[/green] {report_path}")
 
     # Save summary JSON
     summary_data = []
@@ -486,6 +597,7 @@ def main():
             "model": e["model"],
             "error": e["error"],
             "time_seconds": e["time_seconds"],
+            "cached": e.get("cached", False),
         }
         if e["result"]:
             r = e["result"]
@@ -501,8 +613,7 @@ def main():
         summary_data.append(item)
 
     summary_path = output_dir / "comparison_summary.json"
-    with open(summary_path, "w", encoding="utf-8") as f:
-        json.dump(summary_data, f, ensure_ascii=False, indent=2)
+    write_json(summary_path, summary_data)
     console.print(f"[green]Summary JSON saved to:[/green] {summary_path}")
 
 
@@ -9,26 +9,64 @@ Usage:
     python scripts/validate.py output/gpt-5.2.json
     python scripts/validate.py output/gemini-3.1-pro.json --verbose
     python scripts/validate.py --compare output/gpt-5.2.json output/gemini-3.1-pro.json
+    python scripts/validate.py --batch output/ -j 8
+
+Reports are cached under the parse cache directory (validate/ in
+$EXAM_PARSER_CACHE_DIR or $XDG_CACHE_HOME/exam_pdf_parser) keyed by file contents,
+options and validator code, so unchanged outputs are replayed on re-runs (--no-cache
+to bypass; delete the directory to clear it).
 """
 
 import argparse
+import contextlib
+import hashlib
+import io
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
+from typing import NamedTuple
+
+import src.evaluator
+from src.evaluator import HAS_RAPIDFUZZ, normalize_text, similarities, similarity
+from src.jsonio import dumps_bytes, read_json, write_bytes
+from src.result_cache import get_cache_dir
 
-from src.evaluator import normalize_text, similarity
+# rich is most of this script's import time; it is loaded by _load_rich() only when a
+# rich console will actually be used (not with --no-rich / --quiet)
+HAS_RICH = False
 
 try:
-    from rich import box
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.table import Table
-    from rich.text import Text
-    HAS_RICH = True
+    import ahocorasick
+    HAS_AHOCORASICK = True
 except ImportError:
-    HAS_RICH = False
-    print("[WARNING] 'rich' not installed. Output will be plain text. Install with: pip install rich")
+    HAS_AHOCORASICK = False
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+# Output files at least this big are stream-parsed (with ijson) for just the keys the
+# validator reads, instead of decoding OCR metrics / raw responses it never looks at
+_STREAM_PARSE_MIN_BYTES = 1 << 20
+# Streamed files: (ijson prefix, path in the returned dict) for each single value the reports read
+_STREAMED_VALUES = (("model_name", ("model_name",)), ("parsed_exam.exam_info", ("parsed_exam", "exam_info")))
+# Non-empty passages of questions outside CHECK_PLANS are only tested for truthiness
+_ELIDED_PASSAGE = "…"
+
+# The same ground-truth strings and field values get normalized over and over
+# (every check, both columns of --compare); memoize the regex work.
+_normalize = lru_cache(maxsize=2048)(normalize_text)
+
+# Same for similarity: --batch runs and the compare tables score identical pairs repeatedly.
+# Keyed on the ordered (a, b) pair: difflib's ratio is not symmetric, so (b, a) is a separate entry.
+_similarity = lru_cache(maxsize=4096)(similarity)
 
 # ---------------------------------------------------------------------------
 # GROUND TRUTH DATA
@@ -154,9 +192,199 @@ GROUND_TRUTH = {
 # Helpers
 # ---------------------------------------------------------------------------
 
+def _load_rich() -> bool:
+    """Import rich into module globals on first use. Returns HAS_RICH."""
+    global HAS_RICH, box, Console, Panel, Table, Text
+    if HAS_RICH:
+        return True
+    try:
+        from rich import box
+        from rich.console import Console
+        from rich.panel import Panel
+        from rich.table import Table
+        from rich.text import Text
+    except ImportError:
+        print("[WARNING] 'rich' not installed. Output will be plain text. Install with: pip install rich")
+        return False
+    HAS_RICH = True
+    return True
+
+
+def _build_matcher(patterns) -> "ahocorasick.Automaton | None":
+    """Aho–Corasick automaton over patterns, or None without pyahocorasick (or patterns)."""
+    patterns = set(patterns)
+    if not HAS_AHOCORASICK or not patterns:
+        return None
+    automaton = ahocorasick.Automaton()
+    for p in patterns:
+        automaton.add_word(p, p)
+    automaton.make_automaton()
+    return automaton
+
+
+def _find_patterns(text: str, patterns, matcher) -> set[str]:
+    """Which of patterns occur in text: one automaton pass when available, else one ``in`` per pattern.
+
+    The automaton may also report patterns outside ``patterns``; callers only test membership.
+    A ``re`` alternation is not used as the fallback: for a handful of phrases it is several
+    times slower than CPython's substring search and misses overlapping matches.
+    """
+    if matcher is not None:
+        return {p for _, p in matcher.iter(text)}
+    return {p for p in patterns if p in text}
+
+
+class CheckPlan(NamedTuple):
+    """A GROUND_TRUTH entry flattened once at import into exactly what the field checkers read.
+
+    Strings are pre-normalized / pre-lowercased and defaults are resolved, so the
+    per-question checks do no dict lookups or normalization on the reference side.
+    """
+
+    qnum: int
+    question_type: str
+    points: int
+    question_text: str                         # normalized
+    question_text_key_phrases: tuple[str, ...]
+    has_ref_passage: bool
+    passage: str                               # normalized
+    passage_threshold: float
+    passage_starts_prefix: str | None          # first 30 chars; None when unconstrained
+    passage_starts_with_lower: str             # first 20 chars, lowercased
+    passage_starts_display: str                # first 40 chars, for the mismatch detail
+    passage_key_phrases: tuple[str, ...]
+    passage_key_phrases_lower: tuple[str, ...]
+    passage_phrase_matcher: "ahocorasick.Automaton | None"
+    choice_threshold: float
+    choice_nums: tuple[int, ...]
+    choice_texts: tuple[str, ...]              # normalized, parallel to choice_nums
+    choice_rules: dict[int, tuple[tuple[str, bool], ...]]  # num -> ((needle, must_be_present), ...)
+    choice_rule_needles: dict[int, tuple[str, ...]]        # num -> needles of choice_rules[num]
+    choice_rule_matcher: "ahocorasick.Automaton | None"    # every needle of this question
+    question_type_normalized: str
+
+
+def build_check_plan(gt: dict) -> CheckPlan:
+    """Flatten one ground-truth dict into a CheckPlan."""
+    ref_choices = gt.get("choices_reference", gt.get("choices", []))
+
+    # Substring rules per choice, in the order they are reported: text_must_* from
+    # "choices" (Q20) first, then "choice_constraints" (Q22)
+    rules: dict[int, list[tuple[str, bool]]] = {}
+    for c in gt.get("choices", []):
+        checks = [(needle, present) for key, present in (
+            ("text_must_contain", True), ("text_must_not_contain", False), ("text_must_contain2", True),
+        ) if (needle := c.get(key))]
+        if checks:
+            rules[c["number"]] = checks
+    for num, c in gt.get("choice_constraints", {}).items():
+        checks = [(needle, present) for key, present in (
+            ("must_contain", True), ("must_not_contain", False),
+        ) if (needle := c.get(key))]
+        if checks:
+            rules.setdefault(num, []).extend(checks)
+
+    starts_with = gt.get("passage_starts_with")
+    key_phrases = tuple(gt.get("passage_key_phrases", []))
+    return CheckPlan(
+        qnum=gt["question_number"],
+        question_type=gt.get("question_type", ""),
+        points=gt["points"],
+        question_text=_normalize(gt["question_text"]),
+        question_text_key_phrases=tuple(gt.get("question_text_key_phrases", [])),
+        has_ref_passage=bool(gt.get("passage", "")),
+        passage=_normalize(gt.get("passage", "")),
+        passage_threshold=gt.get("passage_similarity_threshold", 0.85),
+        passage_starts_prefix=starts_with[:30] if starts_with else None,
+        passage_starts_with_lower=(starts_with or "")[:20].lower(),
+        passage_starts_display=(starts_with or "")[:40],
+        passage_key_phrases=key_phrases,
+        passage_key_phrases_lower=tuple(p.lower() for p in key_phrases),
+        passage_phrase_matcher=_build_matcher(p.lower() for p in key_phrases),
+        choice_threshold=gt.get("choice_similarity_threshold", 0.75),
+        choice_nums=tuple(c["number"] for c in ref_choices),
+        choice_texts=tuple(_normalize(c["text"]) for c in ref_choices),
+        choice_rules={num: tuple(checks) for num, checks in rules.items()},
+        choice_rule_needles={num: tuple(needle for needle, _ in checks) for num, checks in rules.items()},
+        choice_rule_matcher=_build_matcher(needle for checks in rules.values() for needle, _ in checks),
+        question_type_normalized=_normalize(gt.get("question_type", "")),
+    )
+
+
+CHECK_PLANS = {qnum: build_check_plan(gt) for qnum, gt in GROUND_TRUTH.items()}
+
+
+def _cheap_similarity(a: str, b: str) -> float | None:
+    """Settle a similarity without running the matcher when possible; None if it must run.
+
+    Only exact shortcuts: identical strings score 1.0 and an empty side scores 0.0,
+    as the matcher would. Every score is shown in the report and averaged, so no
+    bound-based estimate stands in for a real ratio.
+    """
+    if a == b:
+        return 1.0
+    if not a or not b:
+        return 0.0
+    return None
+
+
+def _fast_sim(a: str, b: str) -> float:
+    sim = _cheap_similarity(a, b)
+    return _similarity(a, b) if sim is None else sim
+
+
+def _fast_sims(pairs: list[tuple[str, str]]) -> list[float]:
+    """_fast_sim over many pairs; only the undecided ones go to the batched matcher."""
+    sims = [_cheap_similarity(a, b) for a, b in pairs]
+    pending = [i for i, sim in enumerate(sims) if sim is None]
+    for i, sim in zip(pending, similarities([pairs[i] for i in pending])):
+        sims[i] = sim
+    return sims
+
+
 def load_json(path: str) -> dict:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    if HAS_IJSON and os.path.getsize(path) >= _STREAM_PARSE_MIN_BYTES:
+        return _load_used_keys(path)
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so main()'s handler still applies
+    return read_json(path)
+
+
+def _load_used_keys(path: str) -> dict:
+    """Stream only what the validator reads, question by question.
+
+    model_name and exam_info stop their pass as soon as they are read. Questions are
+    streamed one at a time and only those in CHECK_PLANS are kept whole; the rest keep
+    just what check_structure looks at (number, points, whether the passage is empty),
+    so memory is bounded by one question rather than by the whole document.
+    """
+    data: dict = {"parsed_exam": {}}
+    try:
+        with open(path, "rb") as f:
+            for prefix, (*parents, key) in _STREAMED_VALUES:
+                f.seek(0)
+                for value in ijson.items(f, prefix, use_float=True):
+                    target = data
+                    for parent in parents:
+                        target = target[parent]
+                    target[key] = value
+                    break
+            f.seek(0)
+            data["parsed_exam"]["questions"] = [
+                _slim_question(q) for q in ijson.items(f, "parsed_exam.questions.item", use_float=True)
+            ]
+    except ijson.JSONError as e:
+        raise json.JSONDecodeError(str(e), "", 0) from e
+    return data
+
+
+def _slim_question(q):
+    """q itself for CHECK_PLANS questions; otherwise just the fields the structural checks read."""
+    if not isinstance(q, dict) or q.get("number") in CHECK_PLANS:
+        return q
+    slim = {key: q[key] for key in ("number", "points") if key in q}
+    if "passage" in q:
+        slim["passage"] = q["passage"] if not q["passage"] else _ELIDED_PASSAGE
+    return slim
 
 
 def extract_questions(data: dict) -> dict:
@@ -173,7 +401,7 @@ def extract_exam_info(data: dict) -> dict:
 # Field Checkers
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FieldResult:
     field: str
     passed: bool
@@ -181,13 +409,11 @@ class FieldResult:
     detail: str
 
 
-def check_question_text(q: dict, gt: dict) -> FieldResult:
-    actual = normalize_text(q.get("question_text", ""))
-    expected = normalize_text(gt["question_text"])
-    sim = similarity(actual, expected)
+def check_question_text(q: dict, plan: CheckPlan) -> FieldResult:
+    actual = _normalize(q.get("question_text", ""))
+    sim = _fast_sim(actual, plan.question_text)
     # Check key phrases
-    phrases = gt.get("question_text_key_phrases", [])
-    missing = [p for p in phrases if p not in actual]
+    missing = [p for p in plan.question_text_key_phrases if p not in actual]
     passed = sim >= 0.80 and not missing
     detail = f"similarity={sim:.3f}"
     if missing:
@@ -195,27 +421,30 @@ def check_question_text(q: dict, gt: dict) -> FieldResult:
     return FieldResult("question_text", passed, sim, detail)
 
 
-def check_passage(q: dict, gt: dict) -> FieldResult:
-    actual = normalize_text(q.get("passage") or "")
-    threshold = gt.get("passage_similarity_threshold", 0.85)
+def check_passage(q: dict, plan: CheckPlan, passage_sim: float | None = None) -> FieldResult:
+    """``passage_sim`` is a precomputed reference similarity (see score_passages)."""
+    actual = _normalize(q.get("passage") or "")
+    actual_lower = actual.lower()
+    threshold = plan.passage_threshold
 
     # Check starts_with constraint
-    starts_with = gt.get("passage_starts_with")
-    if starts_with and not actual.startswith(starts_with[:30]):
+    starts_prefix = plan.passage_starts_prefix
+    if starts_prefix and not actual.startswith(starts_prefix):
         # Loose check: first 30 chars
-        starts_ok = starts_with[:20].lower() in actual.lower()
+        starts_ok = plan.passage_starts_with_lower in actual_lower
     else:
         starts_ok = True
 
-    # Check key phrases
-    key_phrases = gt.get("passage_key_phrases", [])
-    missing_phrases = [p for p in key_phrases if p.lower() not in actual.lower()]
+    # Check key phrases (GT phrases are lowercased once at import)
+    key_phrases = plan.passage_key_phrases
+    found = _find_patterns(actual_lower, plan.passage_key_phrases_lower, plan.passage_phrase_matcher)
+    missing_phrases = [
+        p for p, p_lower in zip(key_phrases, plan.passage_key_phrases_lower) if p_lower not in found
+    ]
 
     # Similarity against reference passage if available
-    ref_passage = gt.get("passage", "")
-    if ref_passage:
-        ref_normalized = normalize_text(ref_passage)
-        sim = similarity(actual, ref_normalized)
+    if plan.has_ref_passage:
+        sim = _fast_sim(actual, plan.passage) if passage_sim is None else passage_sim
     else:
         # No reference passage; rely on key phrases only
         sim = 1.0 - (len(missing_phrases) / max(len(key_phrases), 1))
@@ -223,42 +452,46 @@ def check_passage(q: dict, gt: dict) -> FieldResult:
     passed = sim >= threshold and starts_ok and not missing_phrases
     detail = f"similarity={sim:.3f}"
     if not starts_ok:
-        detail += f" | passage start mismatch (expected: '{starts_with[:40]}...')"
+        detail += f" | passage start mismatch (expected: '{plan.passage_starts_display}...')"
     if missing_phrases:
         detail += f" | missing key phrases: {missing_phrases}"
     return FieldResult("passage", passed, sim, detail)
 
 
-def check_choices(q: dict, gt: dict, verbose: bool = False) -> list:
-    """Returns list of FieldResult, one per choice."""
-    actual_choices = q.get("choices", [])
-    results = []
-
-    # Build actual lookup by number
-    actual_by_num = {c["number"]: c for c in actual_choices}
-
-    # Count check
+def check_choices_count(q: dict) -> FieldResult:
     expected_count = 5
-    actual_count = len(actual_choices)
+    actual_count = len(q.get("choices", []))
     count_passed = actual_count == expected_count
-    results.append(FieldResult(
+    return FieldResult(
         "choices_count",
         count_passed,
         1.0 if count_passed else 0.0,
         f"actual={actual_count}, expected={expected_count}"
-    ))
+    )
 
-    # Use choices_reference if available, else choices
-    ref_choices = gt.get("choices_reference", gt.get("choices", []))
-    threshold = gt.get("choice_similarity_threshold", 0.75)
-    constraints = gt.get("choice_constraints", {})
 
-    for ref_c in ref_choices:
-        num = ref_c["number"]
-        ref_text = normalize_text(ref_c["text"])
-        actual_c = actual_by_num.get(num)
+def check_choice_texts(q: dict, plan: CheckPlan, verbose: bool = False) -> list:
+    """Returns list of FieldResult, one per reference choice (similarity + constraints)."""
+    results = []
 
-        if actual_c is None:
+    # Build actual lookup by number
+    actual_by_num = {c["number"]: c for c in q.get("choices", [])}
+
+    threshold = plan.choice_threshold
+    rules = plan.choice_rules
+
+    # Normalize every present choice first so the similarities are scored in one batch
+    matched = []
+    for num, ref_text in zip(plan.choice_nums, plan.choice_texts):
+        actual_c = actual_by_num.get(num)
+        actual_text = None if actual_c is None else _normalize(actual_c.get("text", ""))
+        matched.append((num, ref_text, actual_text))
+    sims = iter(_fast_sims([
+        (actual_text, ref_text) for _, ref_text, actual_text in matched if actual_text is not None
+    ]))
+
+    for num, ref_text, actual_text in matched:
+        if actual_text is None:
             results.append(FieldResult(
                 f"choice_{num}",
                 False,
@@ -267,36 +500,18 @@ def check_choices(q: dict, gt: dict, verbose: bool = False) -> list:
             ))
             continue
 
-        actual_text = normalize_text(actual_c.get("text", ""))
-        sim = similarity(actual_text, ref_text)
+        sim = next(sims)
 
+        # Substring constraints (Q20 text_must_*, Q22 choice_constraints)
         issues = []
-
-        # Constraint checks from choices_reference list (for Q20)
-        gt_choice = None
-        if "choices" in gt:
-            gt_choices_by_num = {c["number"]: c for c in gt.get("choices", [])}
-            gt_choice = gt_choices_by_num.get(num)
-
-        if gt_choice:
-            must_contain = gt_choice.get("text_must_contain")
-            must_not_contain = gt_choice.get("text_must_not_contain")
-            must_contain2 = gt_choice.get("text_must_contain2")
-            if must_contain and must_contain not in actual_text:
-                issues.append(f"must contain '{must_contain}'")
-            if must_not_contain and must_not_contain in actual_text:
-                issues.append(f"must NOT contain '{must_not_contain}' (found it)")
-            if must_contain2 and must_contain2 not in actual_text:
-                issues.append(f"must contain '{must_contain2}'")
-
-        # choice_constraints (for Q22)
-        if num in constraints:
-            c_must = constraints[num].get("must_contain")
-            c_must_not = constraints[num].get("must_not_contain")
-            if c_must and c_must not in actual_text:
-                issues.append(f"must contain '{c_must}'")
-            if c_must_not and c_must_not in actual_text:
-                issues.append(f"must NOT contain '{c_must_not}' (found it)")
+        choice_rules = rules.get(num, ())
+        if choice_rules:
+            found = _find_patterns(actual_text, plan.choice_rule_needles[num], plan.choice_rule_matcher)
+            for needle, must_be_present in choice_rules:
+                if must_be_present and needle not in found:
+                    issues.append(f"must contain '{needle}'")
+                elif not must_be_present and needle in found:
+                    issues.append(f"must NOT contain '{needle}' (found it)")
 
         passed = sim >= threshold and not issues
         detail = f"similarity={sim:.3f}"
@@ -310,9 +525,14 @@ def check_choices(q: dict, gt: dict, verbose: bool = False) -> list:
     return results
 
 
-def check_points(q: dict, gt: dict) -> FieldResult:
+def check_choices(q: dict, plan: CheckPlan, verbose: bool = False) -> list:
+    """Returns list of FieldResult: the choice count, then one per choice."""
+    return [check_choices_count(q), *check_choice_texts(q, plan, verbose=verbose)]
+
+
+def check_points(q: dict, plan: CheckPlan) -> FieldResult:
     actual = q.get("points")
-    expected = gt["points"]
+    expected = plan.points
     passed = actual == expected
     return FieldResult(
         "points",
@@ -322,13 +542,12 @@ def check_points(q: dict, gt: dict) -> FieldResult:
     )
 
 
-def check_question_type(q: dict, gt: dict) -> FieldResult:
+def check_question_type(q: dict, plan: CheckPlan) -> FieldResult:
     actual = q.get("question_type")
     passed = actual is not None and actual != ""
     # Also check it's somewhat reasonable
-    expected_type = gt.get("question_type", "")
-    sim = similarity(normalize_text(actual or ""), normalize_text(expected_type))
-    detail = f"actual='{actual}', expected='{expected_type}', similarity={sim:.2f}"
+    sim = _similarity(_normalize(actual or ""), plan.question_type_normalized)
+    detail = f"actual='{actual}', expected='{plan.question_type}', similarity={sim:.2f}"
     # Partial credit: not null is the minimum
     return FieldResult("question_type", passed, sim if passed else 0.0, detail)
 
@@ -338,38 +557,120 @@ def check_question_type(q: dict, gt: dict) -> FieldResult:
 # ---------------------------------------------------------------------------
 
 class QuestionValidationResult:
+    __slots__ = ("qnum", "field_results", "found")
+
     def __init__(self, qnum: int):
         self.qnum = qnum
         self.field_results: list[FieldResult] = []
         self.found = True
 
+    def tally(self) -> tuple[int, int, float]:
+        """(passed fields, total fields, score sum) in one pass over field_results."""
+        n_passed = 0
+        score_sum = 0.0
+        for r in self.field_results:
+            n_passed += r.passed
+            score_sum += r.score
+        return n_passed, len(self.field_results), score_sum
+
     @property
     def passed(self) -> bool:
-        return self.found and all(r.passed for r in self.field_results)
+        if not self.found:
+            return False
+        n_passed, total, _ = self.tally()
+        return n_passed == total
 
     @property
     def score(self) -> float:
         if not self.found:
             return 0.0
-        if not self.field_results:
-            return 1.0
-        return sum(r.score for r in self.field_results) / len(self.field_results)
+        _, total, score_sum = self.tally()
+        return score_sum / total if total else 1.0
 
     @property
     def pass_rate(self) -> float:
-        if not self.found or not self.field_results:
+        if not self.found:
             return 0.0
-        return sum(1 for r in self.field_results if r.passed) / len(self.field_results)
+        n_passed, total, _ = self.tally()
+        return n_passed / total if total else 0.0
+
+
+def score_passages(questions: dict, plans) -> dict[int, float]:
+    """Reference-passage similarity for every found question, scored as one batch.
+
+    Passages are by far the longest strings compared; batching them lets rapidfuzz
+    score all questions in one multi-threaded cpdist call. Results match check_passage.
+    """
+    sims: dict[int, float] = {}
+    pending = []
+    for plan in plans:
+        q = questions.get(plan.qnum)
+        if q is None or not plan.has_ref_passage:
+            continue
+        actual = _normalize(q.get("passage") or "")
+        sim = _cheap_similarity(actual, plan.passage)
+        if sim is None:
+            pending.append((plan.qnum, actual, plan.passage))
+        else:
+            sims[plan.qnum] = sim
+    scores = similarities([(actual, ref) for _, actual, ref in pending], workers=-1)
+    for (qnum, _, _), sim in zip(pending, scores):
+        sims[qnum] = sim
+    return sims
+
+
+def validate_question_cheap(q: dict, plan: CheckPlan) -> tuple[FieldResult, FieldResult, FieldResult]:
+    """Checks that need no text similarity: (choices_count, points, question_type)."""
+    return check_choices_count(q), check_points(q, plan), check_question_type(q, plan)
+
+
+def validate_question_expensive(
+    q: dict, plan: CheckPlan, verbose: bool = False, passage_sim: float | None = None,
+) -> tuple[FieldResult, FieldResult, list[FieldResult]]:
+    """Similarity-heavy checks: (question_text, passage, per-choice results)."""
+    return (
+        check_question_text(q, plan),
+        check_passage(q, plan, passage_sim=passage_sim),
+        check_choice_texts(q, plan, verbose=verbose),
+    )
 
 
-def validate_question(q: dict, gt: dict, verbose: bool = False) -> QuestionValidationResult:
-    result = QuestionValidationResult(gt["question_number"])
+def _skipped_expensive(plan: CheckPlan) -> tuple[FieldResult, FieldResult, list[FieldResult]]:
+    """validate_question_expensive-shaped FAIL results, produced without running the matcher."""
+    def skipped(field: str) -> FieldResult:
+        return FieldResult(field, False, 0.0, "skipped (cheap fail)")
 
-    result.field_results.append(check_question_text(q, gt))
-    result.field_results.append(check_passage(q, gt))
-    result.field_results.extend(check_choices(q, gt, verbose=verbose))
-    result.field_results.append(check_points(q, gt))
-    result.field_results.append(check_question_type(q, gt))
+    return skipped("question_text"), skipped("passage"), [skipped(f"choice_{num}") for num in plan.choice_nums]
+
+
+def validate_question(
+    q: dict,
+    plan: CheckPlan | dict,
+    verbose: bool = False,
+    fast_fail: bool = False,
+    skip_expensive: bool = False,
+    passage_sim: float | None = None,
+) -> QuestionValidationResult:
+    """Run every field check for one question. ``plan`` may also be a raw ground-truth dict.
+
+    The cheap checks run first. With ``fast_fail``, a cheap failure (or
+    ``skip_expensive``, e.g. after a structural failure) marks the similarity
+    fields as skipped instead of scoring them.
+    """
+    if isinstance(plan, dict):
+        plan = build_check_plan(plan)
+    result = QuestionValidationResult(plan.qnum)
+
+    choices_count, points, question_type = validate_question_cheap(q, plan)
+    if fast_fail and (skip_expensive or not (choices_count.passed and points.passed and question_type.passed)):
+        question_text, passage, choices = _skipped_expensive(plan)
+    else:
+        question_text, passage, choices = validate_question_expensive(
+            q, plan, verbose=verbose, passage_sim=passage_sim,
+        )
+
+    # Same field order as always: text, passage, count, choices, points, type
+    result.field_results = [question_text, passage, choices_count, *choices, points, question_type]
 
     return result
 
@@ -379,6 +680,8 @@ def validate_question(q: dict, gt: dict, verbose: bool = False) -> QuestionValid
 # ---------------------------------------------------------------------------
 
 class StructureResult:
+    __slots__ = ("checks",)
+
     def __init__(self):
         self.checks: list[FieldResult] = []
 
@@ -393,10 +696,17 @@ class StructureResult:
         return sum(1 for c in self.checks if c.passed) / len(self.checks)
 
 
-def check_structure(data: dict) -> StructureResult:
+def check_structure(data: dict, qmap: dict | None = None) -> StructureResult:
+    """Run the whole-exam structural checks.
+
+    Args:
+        data: Parsed output JSON
+        qmap: Precomputed ``extract_questions(data)``; built here when omitted
+    """
     result = StructureResult()
     questions = data.get("parsed_exam", {}).get("questions", [])
-    qmap = {q["number"]: q for q in questions if "number" in q}
+    if qmap is None:
+        qmap = extract_questions(data)
 
     # Total question count
     total = len(questions)
@@ -473,6 +783,33 @@ def check_structure(data: dict) -> StructureResult:
 # Reporting
 # ---------------------------------------------------------------------------
 
+# Column specs (header, add_column kwargs) for the rich report tables, applied by _new_table
+_STRUCT_TABLE_COLUMNS = (
+    ("Check", {"style": "cyan", "no_wrap": True}),
+    ("Status", {"justify": "center", "width": 6}),
+    ("Detail", {}),
+)
+_Q_TABLE_COLUMNS = (
+    ("Field", {"style": "cyan", "no_wrap": True}),
+    ("Status", {"justify": "center", "width": 6}),
+    ("Score", {"justify": "right", "width": 6}),
+    ("Detail", {}),
+)
+_PASSAGE_TABLE_COLUMNS = (
+    ("Question", {"justify": "center"}),
+    ("Similarity", {"justify": "center"}),
+    ("Assessment", {}),
+)
+
+
+def _new_table(title: str, columns, box_name: str = "SIMPLE") -> "Table":
+    """Rich table with a header row and the given column spec (rich must be loaded)."""
+    table = Table(title=title, box=getattr(box, box_name), show_header=True)
+    for header, kwargs in columns:
+        table.add_column(header, **kwargs)
+    return table
+
+
 def make_status_str(passed: bool) -> str:
     return "PASS" if passed else "FAIL"
 
@@ -481,7 +818,8 @@ def report_single(
     path: str,
     data: dict,
     verbose: bool = False,
-    console=None
+    console=None,
+    fast_fail: bool = False,
 ):
     """Generate and print full validation report for one output file."""
     questions = extract_questions(data)
@@ -503,17 +841,10 @@ def report_single(
         print(f"{'='*70}\n")
 
     # --- Structural checks ---
-    struct_result = check_structure(data)
+    struct_result = check_structure(data, questions)
 
     if console and HAS_RICH:
-        struct_table = Table(
-            title="[bold]Structural Checks[/bold]",
-            box=box.SIMPLE_HEAVY,
-            show_header=True,
-        )
-        struct_table.add_column("Check", style="cyan", no_wrap=True)
-        struct_table.add_column("Status", justify="center", width=6)
-        struct_table.add_column("Detail")
+        struct_table = _new_table("[bold]Structural Checks[/bold]", _STRUCT_TABLE_COLUMNS, box_name="SIMPLE_HEAVY")
 
         for c in struct_result.checks:
             status_style = "green" if c.passed else "red"
@@ -536,7 +867,9 @@ def report_single(
 
     # --- Per-question checks ---
     q_results: dict[int, QuestionValidationResult] = {}
-    for qnum, gt in GROUND_TRUTH.items():
+    # With --fast-fail most passages may never be scored, so don't prescore them
+    passage_sims = {} if fast_fail else score_passages(questions, CHECK_PLANS.values())
+    for qnum, plan in CHECK_PLANS.items():
         q = questions.get(qnum)
         if q is None:
             r = QuestionValidationResult(qnum)
@@ -547,20 +880,18 @@ def report_single(
             else:
                 print(f"  Q{qnum}: NOT FOUND in output")
         else:
-            q_results[qnum] = validate_question(q, gt, verbose=verbose)
+            q_results[qnum] = validate_question(
+                q, plan, verbose=verbose, fast_fail=fast_fail, skip_expensive=not struct_result.passed,
+                passage_sim=passage_sims.get(qnum),
+            )
 
     # Print per-question tables
     for qnum, qr in q_results.items():
         if console and HAS_RICH:
-            q_table = Table(
-                title=f"[bold]Q{qnum} — {GROUND_TRUTH[qnum]['question_type']} ({GROUND_TRUTH[qnum]['points']}pt)[/bold]",
-                box=box.SIMPLE,
-                show_header=True,
+            q_table = _new_table(
+                f"[bold]Q{qnum} — {CHECK_PLANS[qnum].question_type} ({CHECK_PLANS[qnum].points}pt)[/bold]",
+                _Q_TABLE_COLUMNS,
             )
-            q_table.add_column("Field", style="cyan", no_wrap=True)
-            q_table.add_column("Status", justify="center", width=6)
-            q_table.add_column("Score", justify="right", width=6)
-            q_table.add_column("Detail")
 
             for fr in qr.field_results:
                 status_style = "green" if fr.passed else "red"
@@ -577,7 +908,7 @@ def report_single(
                 f"(field pass rate: {qr.pass_rate*100:.1f}%, avg score: {qr.score:.3f})"
             )
         else:
-            print(f"\nQ{qnum} — {GROUND_TRUTH[qnum]['question_type']} ({GROUND_TRUTH[qnum]['points']}pt)")
+            print(f"\nQ{qnum} — {CHECK_PLANS[qnum].question_type} ({CHECK_PLANS[qnum].points}pt)")
             print("-" * 50)
             for fr in qr.field_results:
                 print(f"  [{make_status_str(fr.passed)}] {fr.field} (score={fr.score:.2f}): {fr.detail}")
@@ -588,11 +919,12 @@ def report_single(
     all_struct_passed = struct_result.passed
     overall_passed = all_q_passed and all_struct_passed
 
-    total_fields = sum(len(qr.field_results) for qr in q_results.values()) + len(struct_result.checks)
-    passed_fields = (
-        sum(sum(1 for fr in qr.field_results if fr.passed) for qr in q_results.values())
-        + sum(1 for c in struct_result.checks if c.passed)
-    )
+    passed_fields = sum(c.passed for c in struct_result.checks)
+    total_fields = len(struct_result.checks)
+    for qr in q_results.values():
+        n_passed, total, _ = qr.tally()
+        passed_fields += n_passed
+        total_fields += total
     accuracy = passed_fields / total_fields * 100 if total_fields else 0.0
 
     if console and HAS_RICH:
@@ -623,6 +955,17 @@ def report_single(
 # Compare Mode
 # ---------------------------------------------------------------------------
 
+_COMPARE_FIELDS = ("question_text", "passage", "points", "question_type")
+
+
+class CompareRow(NamedTuple):
+    """One question's compare-mode field values (normalized, truncated to 60 chars)."""
+
+    qnum: int
+    question_type: str
+    fields: list[tuple[str, str, str]]  # (field, value in A, value in B)
+
+
 def report_compare(path_a: str, path_b: str, verbose: bool = False, console=None):
     """Compare two output files side by side."""
     data_a = load_json(path_a)
@@ -646,26 +989,49 @@ def report_compare(path_a: str, path_b: str, verbose: bool = False, console=None
         print(f"  B: {path_b} ({name_b})")
         print(f"{'='*70}\n")
 
-    for qnum, gt in GROUND_TRUTH.items():
+    # Column spec for the per-question compare tables (same model names for every question)
+    cmp_columns = (
+        ("Field", {"style": "cyan", "no_wrap": True, "width": 16}),
+        (f"A: {name_a[:20]}", {"width": 35}),
+        (f"B: {name_b[:20]}", {"width": 35}),
+        ("Same?", {"justify": "center", "width": 6}),
+    )
+
+    # One pass over the questions collects every compared value; the choice and passage
+    # similarities are then each scored as one batch
+    rows = []
+    choice_pairs = []
+    passage_pairs = {}
+    for qnum, plan in CHECK_PLANS.items():
         q_a = qa.get(qnum)
         q_b = qb.get(qnum)
+        fields = [
+            (
+                field,
+                _normalize(str(q_a.get(field, "N/A") if q_a else "MISSING"))[:60],
+                _normalize(str(q_b.get(field, "N/A") if q_b else "MISSING"))[:60],
+            )
+            for field in _COMPARE_FIELDS
+        ]
+        choices_a = {c["number"]: c["text"] for c in (q_a.get("choices", []) if q_a else [])}
+        choices_b = {c["number"]: c["text"] for c in (q_b.get("choices", []) if q_b else [])}
+        choice_pairs.extend(
+            (_normalize(choices_a.get(n, "MISSING"))[:60], _normalize(choices_b.get(n, "MISSING"))[:60])
+            for n in range(1, 6)
+        )
+        if q_a and q_b:
+            passage_pairs[qnum] = (_normalize(q_a.get("passage") or ""), _normalize(q_b.get("passage") or ""))
+        rows.append(CompareRow(qnum, plan.question_type, fields))
 
-        fields_to_compare = ["question_text", "passage", "points", "question_type"]
+    choice_sims = similarities(choice_pairs)
+    passage_sims = dict(zip(passage_pairs, similarities(list(passage_pairs.values()), workers=-1)))
 
+    for i, row in enumerate(rows):
+        choices = zip(range(1, 6), choice_pairs[5 * i:5 * i + 5], choice_sims[5 * i:5 * i + 5])
         if console and HAS_RICH:
-            cmp_table = Table(
-                title=f"[bold]Q{qnum} — {gt['question_type']}[/bold]",
-                box=box.SIMPLE,
-                show_header=True,
-            )
-            cmp_table.add_column("Field", style="cyan", no_wrap=True, width=16)
-            cmp_table.add_column(f"A: {name_a[:20]}", width=35)
-            cmp_table.add_column(f"B: {name_b[:20]}", width=35)
-            cmp_table.add_column("Same?", justify="center", width=6)
-
-            for field in fields_to_compare:
-                val_a = normalize_text(str(q_a.get(field, "N/A") if q_a else "MISSING"))[:60]
-                val_b = normalize_text(str(q_b.get(field, "N/A") if q_b else "MISSING"))[:60]
+            cmp_table = _new_table(f"[bold]Q{row.qnum} — {row.question_type}[/bold]", cmp_columns)
+
+            for field, val_a, val_b in row.fields:
                 same = val_a == val_b
                 cmp_table.add_row(
                     field,
@@ -674,13 +1040,7 @@ def report_compare(path_a: str, path_b: str, verbose: bool = False, console=None
                     Text("YES" if same else "NO", style="green" if same else "red"),
                 )
 
-            # Choices
-            choices_a = {c["number"]: c["text"] for c in (q_a.get("choices", []) if q_a else [])}
-            choices_b = {c["number"]: c["text"] for c in (q_b.get("choices", []) if q_b else [])}
-            for n in range(1, 6):
-                ca = normalize_text(choices_a.get(n, "MISSING"))[:60]
-                cb = normalize_text(choices_b.get(n, "MISSING"))[:60]
-                sim = similarity(ca, cb)
+            for n, (ca, cb), sim in choices:
                 same = sim >= 0.90
                 cmp_table.add_row(
                     f"choice_{n}",
@@ -691,74 +1051,158 @@ def report_compare(path_a: str, path_b: str, verbose: bool = False, console=None
 
             console.print(cmp_table)
         else:
-            print(f"\nQ{qnum} — {gt['question_type']}")
+            print(f"\nQ{row.qnum} — {row.question_type}")
             print("-" * 70)
-            for field in fields_to_compare:
-                val_a = normalize_text(str(q_a.get(field, "N/A") if q_a else "MISSING"))[:60]
-                val_b = normalize_text(str(q_b.get(field, "N/A") if q_b else "MISSING"))[:60]
+            for field, val_a, val_b in row.fields:
                 same = "YES" if val_a == val_b else "NO"
                 print(f"  {field:<18} [{same}]")
                 if verbose or val_a != val_b:
                     print(f"    A: {val_a}")
                     print(f"    B: {val_b}")
 
-            choices_a = {c["number"]: c["text"] for c in (q_a.get("choices", []) if q_a else [])}
-            choices_b = {c["number"]: c["text"] for c in (q_b.get("choices", []) if q_b else [])}
-            for n in range(1, 6):
-                ca = normalize_text(choices_a.get(n, "MISSING"))[:60]
-                cb = normalize_text(choices_b.get(n, "MISSING"))[:60]
-                sim = similarity(ca, cb)
+            for n, (ca, cb), sim in choices:
                 same = "YES" if sim >= 0.90 else f"sim={sim:.2f}"
                 print(f"  choice_{n:<14} [{same}]")
                 if verbose or sim < 0.90:
                     print(f"    A: {ca}")
                     print(f"    B: {cb}")
 
-    # Also compare passage similarity between A and B for each question
     if console and HAS_RICH:
-        pass_table = Table(
-            title="[bold]Passage Similarity (A vs B)[/bold]",
-            box=box.SIMPLE,
-        )
-        pass_table.add_column("Question", justify="center")
-        pass_table.add_column("Similarity", justify="center")
-        pass_table.add_column("Assessment")
-
-        for qnum in GROUND_TRUTH:
-            q_a = qa.get(qnum)
-            q_b = qb.get(qnum)
-            if q_a and q_b:
-                pa = normalize_text(q_a.get("passage") or "")
-                pb = normalize_text(q_b.get("passage") or "")
-                sim = similarity(pa, pb)
-                color = "green" if sim >= 0.95 else "yellow" if sim >= 0.80 else "red"
-                pass_table.add_row(
-                    f"Q{qnum}",
-                    Text(f"{sim:.4f}", style=color),
-                    "Near-identical" if sim >= 0.95 else "Similar" if sim >= 0.80 else "Divergent"
-                )
+        pass_table = _new_table("[bold]Passage Similarity (A vs B)[/bold]", _PASSAGE_TABLE_COLUMNS)
+
+        for qnum, sim in passage_sims.items():
+            color = "green" if sim >= 0.95 else "yellow" if sim >= 0.80 else "red"
+            pass_table.add_row(
+                f"Q{qnum}",
+                Text(f"{sim:.4f}", style=color),
+                "Near-identical" if sim >= 0.95 else "Similar" if sim >= 0.80 else "Divergent"
+            )
         console.print(pass_table)
     else:
         print("\nPassage Similarity (A vs B):")
-        for qnum in GROUND_TRUTH:
-            q_a = qa.get(qnum)
-            q_b = qb.get(qnum)
-            if q_a and q_b:
-                pa = normalize_text(q_a.get("passage") or "")
-                pb = normalize_text(q_b.get("passage") or "")
-                sim = similarity(pa, pb)
-                print(f"  Q{qnum}: {sim:.4f}")
+        for qnum, sim in passage_sims.items():
+            print(f"  Q{qnum}: {sim:.4f}")
+
+
+# ---------------------------------------------------------------------------
+# Report cache
+# ---------------------------------------------------------------------------
+
+# Next to the parse cache rather than in the working directory
+REPORT_CACHE_DIR = get_cache_dir() / "validate"
+
+
+def _validator_fingerprint() -> bytes:
+    """Digest of the code that decides a report: this script (incl. GROUND_TRUTH) and the evaluator.
+
+    Editing either file, or installing/removing rapidfuzz (which changes similarity
+    scores), yields a new fingerprint and so misses every existing cache entry.
+    """
+    h = hashlib.sha256()
+    for source in (__file__, src.evaluator.__file__):
+        h.update(Path(source).read_bytes())
+    h.update(b"rapidfuzz" if HAS_RAPIDFUZZ else b"difflib")
+    return h.digest()
+
+
+def _report_cache_key(path: str, fingerprint: bytes, options: tuple) -> str:
+    """sha256 over the validator fingerprint, the rendering options (incl. the path) and the file contents."""
+    h = hashlib.sha256(fingerprint)
+    h.update(repr(options).encode("utf-8"))
+    with open(path, "rb") as f:
+        while chunk := f.read(1 << 20):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _load_cached_report(cache_dir: Path, key: str) -> dict | None:
+    try:
+        return read_json(cache_dir / f"{key}.json")
+    except (OSError, ValueError):
+        return None
+
+
+def _store_cached_report(cache_dir: Path, key: str, entry: dict) -> None:
+    """Write atomically (tmp file + rename) so a concurrent reader never sees a partial entry."""
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        path = cache_dir / f"{key}.json"
+        tmp = path.with_suffix(f".json.{os.getpid()}.tmp")
+        write_bytes(tmp, dumps_bytes(entry, indent=False))
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"Warning: could not write report cache entry for {key}: {e}", file=sys.stderr)
+
+
+def _validate_file(
+    path: str, verbose: bool, use_rich: bool, terminal: bool, width: int | None, fast_fail: bool = False,
+    cache_dir: Path | None = None, fingerprint: bytes = b"",
+) -> tuple[str, bool | None, str]:
+    """Validate one file and return (path, passed, rendered report).
+
+    The report is rendered into a buffer so parallel workers never interleave
+    their output. ``passed`` is None (and the text is an error message) when the
+    file could not be loaded. With ``cache_dir``, an unchanged file validated with
+    the same options and validator code replays its stored report instead.
+    """
+    key = None
+    if cache_dir is not None:
+        try:
+            # path is part of the key: the report header names the file, so identical copies can't share it
+            key = _report_cache_key(path, fingerprint, (path, verbose, fast_fail, use_rich, terminal, width))
+        except FileNotFoundError:
+            return path, None, f"Error: file not found: {path}\n"
+        cached = _load_cached_report(cache_dir, key)
+        if cached is not None:
+            return path, cached["passed"], cached["report"]
+
+    try:
+        data = load_json(path)
+    except FileNotFoundError:
+        return path, None, f"Error: file not found: {path}\n"
+    except json.JSONDecodeError as e:
+        return path, None, f"Error: invalid JSON in {path}: {e}\n"
+
+    buf = io.StringIO()
+    if use_rich and _load_rich():
+        console = Console(file=buf, force_terminal=terminal, width=width)
+        passed, accuracy = report_single(path, data, verbose=verbose, console=console, fast_fail=fast_fail)
+    else:
+        with contextlib.redirect_stdout(buf):
+            passed, accuracy = report_single(path, data, verbose=verbose, fast_fail=fast_fail)
+    report = buf.getvalue()
+    if key is not None:
+        _store_cached_report(cache_dir, key, {"passed": passed, "accuracy": accuracy, "report": report})
+    return path, passed, report
 
 
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
 
+# A file validates in a few ms (JSON load + four questions), so a worker process only pays for
+# its start-up across a few dozen files; smaller batches stay in-process
+_MIN_FILES_PER_WORKER = 32
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Validate parsed exam JSON against ground truth (Q19-22)."
     )
-    parser.add_argument("files", nargs="+", help="JSON output file(s) to validate")
+    parser.add_argument("files", nargs="*", help="JSON output file(s) to validate")
+    parser.add_argument(
+        "--batch",
+        metavar="DIR",
+        default=None,
+        help="Also validate every *.json file in DIR"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=None,
+        help=f"Worker processes for validating multiple files (default: CPU count, but at most one per "
+             f"{_MIN_FILES_PER_WORKER} files, so small batches run serially)"
+    )
     parser.add_argument(
         "--compare",
         action="store_true",
@@ -769,26 +1213,81 @@ def main():
         action="store_true",
         help="Show extra detail (actual text in choice comparisons, etc.)"
     )
+    parser.add_argument(
+        "--fast-fail",
+        action="store_true",
+        help="Skip similarity checks for questions that already fail structure/points/type/choice-count checks"
+    )
     parser.add_argument(
         "--no-rich",
         action="store_true",
         help="Disable rich formatting even if installed"
     )
+    parser.add_argument(
+        "--quiet", "-q",
+        action="store_true",
+        help="Print no reports (errors only); the exit code tells whether all files passed"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Always re-validate instead of replaying unchanged files' reports from {REPORT_CACHE_DIR}/"
+    )
     args = parser.parse_args()
 
-    use_rich = HAS_RICH and not args.no_rich
+    use_rich = not (args.no_rich or args.quiet) and _load_rich()
     console = Console() if use_rich else None
 
     if args.compare:
         if len(args.files) != 2:
             print("Error: --compare requires exactly 2 file arguments.", file=sys.stderr)
             sys.exit(2)
-        report_compare(args.files[0], args.files[1], verbose=args.verbose, console=console)
+        try:
+            report_compare(args.files[0], args.files[1], verbose=args.verbose, console=console)
+        except FileNotFoundError as e:
+            print(f"Error: file not found: {e.filename}", file=sys.stderr)
+            sys.exit(1)
+        except json.JSONDecodeError as e:
+            print(f"Error: invalid JSON in compared files: {e}", file=sys.stderr)
+            sys.exit(1)
         sys.exit(0)
 
-    # Single or multiple file validation
+    files = list(args.files)
+    if args.batch:
+        files.extend(str(p) for p in sorted(Path(args.batch).glob("*.json")))
+    if not files:
+        parser.error("no input files (pass JSON files and/or --batch DIR)")
+
     all_passed = True
-    for path in args.files:
+    # An explicit -j is taken as given; only the default is scaled down for small batches
+    if args.jobs:
+        jobs = min(args.jobs, len(files))
+    else:
+        jobs = min(os.cpu_count() or 1, len(files) // _MIN_FILES_PER_WORKER)
+    parallel = jobs > 1
+    if parallel or not args.no_cache:
+        # Reports are rendered into buffers (cacheable, and parallel workers never interleave);
+        # files are independent, so with several jobs they are validated in worker processes
+        terminal = console.is_terminal if console else False
+        width = console.width if console else None
+        cache_dir = None if args.no_cache else REPORT_CACHE_DIR
+        fingerprint = b"" if args.no_cache else _validator_fingerprint()
+        worker_args = (
+            files, repeat(args.verbose), repeat(use_rich), repeat(terminal), repeat(width), repeat(args.fast_fail),
+            repeat(cache_dir), repeat(fingerprint),
+        )
+        with ProcessPoolExecutor(max_workers=jobs) if parallel else contextlib.nullcontext() as executor:
+            for _, passed, text in (executor.map if parallel else map)(_validate_file, *worker_args):
+                if passed is None:
+                    sys.stderr.write(text)
+                elif not args.quiet:
+                    sys.stdout.write(text)
+                if not passed:
+                    all_passed = False
+        sys.exit(0 if all_passed else 1)
+
+    # Single or multiple file validation, printed as it goes (--no-cache)
+    for path in files:
         try:
             data = load_json(path)
         except FileNotFoundError:
@@ -800,7 +1299,10 @@ def main():
             all_passed = False
             continue
 
-        passed, accuracy = report_single(path, data, verbose=args.verbose, console=console)
+        with contextlib.redirect_stdout(io.StringIO()) if args.quiet else contextlib.nullcontext():
+            passed, accuracy = report_single(
+                path, data, verbose=args.verbose, console=console, fast_fail=args.fast_fail,
+            )
         if not passed:
             all_passed = False
 
@@ -13,9 +13,11 @@ Usage:
         ...
 """
 
+import hashlib
 import logging
 import os
 import secrets
+from functools import lru_cache
 
 from fastapi import HTTPException, Security, status
 from fastapi.security import APIKeyHeader, APIKeyQuery
@@ -27,8 +29,16 @@ _api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 _api_key_query = APIKeyQuery(name="api_key", auto_error=False)
 
 
-def _load_api_keys() -> frozenset[str]:
-    """Load valid API keys from environment variable.
+def _hash_key(key: str) -> bytes:
+    """Fixed-length digest of an API key, so comparisons take the same time for any key length."""
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+
+
+@lru_cache(maxsize=1)
+def _load_api_keys() -> frozenset[bytes]:
+    """Load valid API keys from environment variable, as _hash_key digests.
+
+    Cached; call clear_api_keys_cache() after changing API_KEYS.
 
     Returns an empty frozenset if API_KEYS is not set (auth disabled).
     환경 변수에서 유효한 API 키를 로드합니다. 미설정 시 인증 비활성화.
@@ -37,7 +47,12 @@ def _load_api_keys() -> frozenset[str]:
     if not raw:
         return frozenset()
     keys = {k.strip() for k in raw.split(",") if k.strip()}
-    return frozenset(keys)
+    return frozenset(_hash_key(k) for k in keys)
+
+
+def clear_api_keys_cache() -> None:
+    """Clear the cached API key set so API_KEYS is re-read. Useful for testing."""
+    _load_api_keys.cache_clear()
 
 
 async def require_api_key(
@@ -69,7 +84,14 @@ async def require_api_key(
             headers={"WWW-Authenticate": "ApiKey"},
         )
 
-    if not any(secrets.compare_digest(provided_key, vk) for vk in valid_keys):
+    # Compare digests against every key without short-circuiting, so timing reveals
+    # neither the key length nor which (or whether any) key matched
+    provided_hash = _hash_key(provided_key)
+    matched = False
+    for vk in valid_keys:
+        matched |= secrets.compare_digest(provided_hash, vk)
+
+    if not matched:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid API key.",
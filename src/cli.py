@@ -4,6 +4,7 @@ Command-line interface for exam parser.
 """
 
 import argparse
+import asyncio
 import json
 import sys
 from pathlib import Path
@@ -11,6 +12,7 @@ from pathlib import Path
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 
 from .config import sanitize_model_name
 from .parser import ExamParser
@@ -84,6 +86,26 @@ def compare_results(results: dict) -> None:
     console.print(table)
 
 
+def print_listing(title: str, columns: list[tuple[str, dict]], rows: list[tuple]) -> None:
+    """Print a --list-* listing: a rich Table on a terminal, tab-separated lines otherwise.
+
+    Piped/CI output skips rich's table layout entirely and stays easy to grep or cut.
+    Cells may be strings or rich Text (printed as their plain text when piped).
+    """
+    if not console.is_terminal:
+        lines = ["\t".join(name for name, _ in columns)]
+        lines.extend("\t".join(str(cell) for cell in row) for row in rows)
+        sys.stdout.write("\n".join(lines) + "\n")
+        return
+
+    table = Table(title=title)
+    for name, kwargs in columns:
+        table.add_column(name, **kwargs)
+    for row in rows:
+        table.add_row(*row)
+    console.print(table)
+
+
 def save_results(result: ParseResult, output_path: Path) -> None:
     """Save parse result to JSON file."""
     with open(output_path, 'w', encoding='utf-8') as f:
@@ -164,15 +186,15 @@ def main():
     if args.list_ocr:
         from .ocr import list_available_engines
 
-        table = Table(title="Document Parsers")
-        table.add_column("Engine", style="cyan")
-        table.add_column("Available", style="green")
-
-        for name, info in list_available_engines().items():
-            avail = "[green]Yes[/green]" if info["available"] else "[red]No[/red]"
-            table.add_row(name, avail)
-
-        console.print(table)
+        rows = [
+            (name, Text("Yes", style="green") if info["available"] else Text("No", style="red"))
+            for name, info in list_available_engines().items()
+        ]
+        print_listing(
+            "Document Parsers",
+            [("Engine", {"style": "cyan"}), ("Available", {"style": "green"})],
+            rows,
+        )
         console.print("\n[dim]Install:[/dim]")
         console.print("  mineru: pip install mineru")
         return
@@ -181,23 +203,27 @@ def main():
     if args.list_models:
         from .config import MODEL_CONFIG
 
-        table = Table(title="Supported Models (Document Parser + LLM)")
-        table.add_column("Model", style="cyan")
-        table.add_column("Parser", style="yellow")
-        table.add_column("LLM", style="green")
-        table.add_column("Input ($/1M)", justify="right", style="blue")
-        table.add_column("Output ($/1M)", justify="right", style="magenta")
-
-        for model_name, config in MODEL_CONFIG.items():
-            table.add_row(
+        rows = [
+            (
                 model_name,
                 config["ocr_engine"],
                 config["llm_model"],
                 f"${config['input_price_per_1m']:.2f}",
-                f"${config['output_price_per_1m']:.2f}"
+                f"${config['output_price_per_1m']:.2f}",
             )
-
-        console.print(table)
+            for model_name, config in MODEL_CONFIG.items()
+        ]
+        print_listing(
+            "Supported Models (Document Parser + LLM)",
+            [
+                ("Model", {"style": "cyan"}),
+                ("Parser", {"style": "yellow"}),
+                ("LLM", {"style": "green"}),
+                ("Input ($/1M)", {"justify": "right", "style": "blue"}),
+                ("Output ($/1M)", {"justify": "right", "style": "magenta"}),
+            ],
+            rows,
+        )
         return
 
     # Validate PDF path
@@ -231,7 +257,7 @@ def main():
         else:
             # Parse with all models
             console.print("[blue]Parsing with all available models...[/blue]")
-            results = exam_parser.parse_with_all_models(instruction=args.instruction)
+            results = asyncio.run(exam_parser.aparse_with_all_models(instruction=args.instruction))
 
             if not results:
                 console.print("[red]No models succeeded[/red]")
@@ -6,12 +6,36 @@ Configuration module for exam PDF parser.
 import logging
 import os
 from functools import lru_cache
+from types import MappingProxyType
 
 from dotenv import load_dotenv
 from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
 
+_TRUTHY = frozenset({"true", "1", "yes"})
+
+
+@lru_cache(maxsize=1)
+def _env_defaults() -> dict:
+    """Settings values read from the environment, parsed once (see reload_env_defaults)."""
+    return {
+        "GOOGLE_API_KEY": os.environ.get("GOOGLE_API_KEY"),
+        "API_KEYS": os.environ.get("API_KEYS") or None,
+        "RATE_LIMIT_PER_MINUTE": int(os.environ.get("RATE_LIMIT_PER_MINUTE", "60")),
+        "MAX_CONCURRENT_PARSES": int(os.environ.get("MAX_CONCURRENT_PARSES", "10")),
+        "MINERU_LANGUAGE": os.environ.get("MINERU_LANGUAGE", "korean"),
+        "MINERU_PARSE_METHOD": os.environ.get("MINERU_PARSE_METHOD", "auto"),
+        "MINERU_FORMULA_ENABLE": os.environ.get("MINERU_FORMULA_ENABLE", "true").lower() in _TRUTHY,
+        "MINERU_TABLE_ENABLE": os.environ.get("MINERU_TABLE_ENABLE", "true").lower() in _TRUTHY,
+        "MINERU_MAKE_MODE": os.environ.get("MINERU_MAKE_MODE", "mm_markdown"),
+    }
+
+
+def reload_env_defaults() -> None:
+    """Re-read the environment on the next Settings() (e.g. after load_dotenv or in tests)."""
+    _env_defaults.cache_clear()
+
 
 class Settings(BaseModel):
     """Application settings loaded from environment variables."""
@@ -39,20 +63,8 @@ class Settings(BaseModel):
     MINERU_MAKE_MODE: str = "mm_markdown"    # mm_markdown, nlp_markdown, content_list
 
     def __init__(self, **kwargs):
-        """Load settings from environment variables."""
-        defaults = {
-            "GOOGLE_API_KEY": os.getenv("GOOGLE_API_KEY"),
-            "API_KEYS": os.getenv("API_KEYS") or None,
-            "RATE_LIMIT_PER_MINUTE": int(os.getenv("RATE_LIMIT_PER_MINUTE", "60")),
-            "MAX_CONCURRENT_PARSES": int(os.getenv("MAX_CONCURRENT_PARSES", "10")),
-            "MINERU_LANGUAGE": os.getenv("MINERU_LANGUAGE", "korean"),
-            "MINERU_PARSE_METHOD": os.getenv("MINERU_PARSE_METHOD", "auto"),
-            "MINERU_FORMULA_ENABLE": os.getenv("MINERU_FORMULA_ENABLE", "true").lower() in ("true", "1", "yes"),
-            "MINERU_TABLE_ENABLE": os.getenv("MINERU_TABLE_ENABLE", "true").lower() in ("true", "1", "yes"),
-            "MINERU_MAKE_MODE": os.getenv("MINERU_MAKE_MODE", "mm_markdown"),
-        }
-        defaults.update(kwargs)
-        super().__init__(**defaults)
+        """Load settings from environment variables (parsed once; see reload_env_defaults)."""
+        super().__init__(**{**_env_defaults(), **kwargs})
 
 
 # LLM pricing (USD per 1M tokens)
@@ -83,24 +95,30 @@ def _build_model_config() -> dict:
     return config
 
 
-MODEL_CONFIG = _build_model_config()
+# Built once at import and shared read-only by every importer (parser, server, cli, scripts)
+MODEL_CONFIG = MappingProxyType(_build_model_config())
 
 
 @lru_cache()
 def get_settings() -> Settings:
     """Get cached settings instance."""
     load_dotenv()
+    reload_env_defaults()
     return Settings()
 
 
 def clear_settings_cache() -> None:
-    """Clear the cached settings instance. Useful for testing."""
+    """Clear the cached settings instance (and parsed environment). Useful for testing."""
     get_settings.cache_clear()
+    reload_env_defaults()
+
+
+_SANITIZE_TR = str.maketrans({"/": "_", ":": "_", "+": "-plus-"})
 
 
 def sanitize_model_name(name: str) -> str:
-    """Sanitize model name for use in file paths."""
-    return name.replace("/", "_").replace(":", "_").replace("+", "-plus-")
+    """Sanitize model name for use in file paths (one str.translate pass)."""
+    return name.translate(_SANITIZE_TR)
 
 
 def check_api_key(provider: str) -> bool:
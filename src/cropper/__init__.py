@@ -9,6 +9,7 @@ from pathlib import Path
 
 from ..config import get_settings
 from ..ocr import get_ocr_engine
+from ..result_cache import layout_cache_key, load_cached_layout, store_cached_layout
 from ..schema import CroppedExam, ExamInfo
 from .cropper import QuestionCropper
 from .detector import QuestionRegionDetector
@@ -23,6 +24,9 @@ def crop_and_explain(
     dpi: int = 300,
     add_explanations: bool = False,
     llm_name: str = "gemini-3-pro-preview",
+    use_cache: bool = True,
+    grayscale: bool = False,
+    crop_workers: int | None = None,
 ) -> CroppedExam:
     """
     시험지 PDF → 문제별 크롭 이미지 + 해설.
@@ -39,32 +43,47 @@ def crop_and_explain(
         dpi: Resolution for cropped images (default 300)
         add_explanations: Whether to generate Gemini explanations
         llm_name: Gemini model name for explanations
+        use_cache: Reuse the MinerU layout and explanations cached for identical inputs (see result_cache)
+        grayscale: Crop to grayscale PNGs instead of RGB (faster, smaller files)
+        crop_workers: Worker processes for cropping (default: crop in-process; see
+            QuestionCropper.crop_regions)
 
     Returns:
         CroppedExam with per-question images and optional explanations
     """
     t0 = time.monotonic()
 
-    # 1. MinerU layout analysis
-    logger.info("Step 1: Running MinerU layout analysis on %s", pdf_path)
-    ocr_engine = get_ocr_engine("mineru")
-
+    # 1. MinerU layout analysis (skipped when this PDF's layout is cached)
     settings = get_settings()
-    if hasattr(ocr_engine, "configure"):
-        ocr_engine.configure(
-            language=settings.MINERU_LANGUAGE,
-            parse_method=settings.MINERU_PARSE_METHOD,
-            formula_enable=settings.MINERU_FORMULA_ENABLE,
-            table_enable=settings.MINERU_TABLE_ENABLE,
-            make_mode=settings.MINERU_MAKE_MODE,
-        )
-
-    ocr_engine.set_pdf_path(pdf_path)
-    ocr_engine.extract_from_pdf(pdf_path)
-
-    middle_json = ocr_engine.get_layout_data()
-    if middle_json is None:
-        raise RuntimeError("MinerU did not produce layout data (middle_json). Is MinerU v2.x installed?")
+    mineru_options = {
+        "language": settings.MINERU_LANGUAGE,
+        "parse_method": settings.MINERU_PARSE_METHOD,
+        "formula_enable": settings.MINERU_FORMULA_ENABLE,
+        "table_enable": settings.MINERU_TABLE_ENABLE,
+        "make_mode": settings.MINERU_MAKE_MODE,
+    }
+    cache_key = layout_cache_key(pdf_path, tuple(mineru_options.items())) if use_cache else None
+    middle_json = load_cached_layout(cache_key) if cache_key else None
+
+    if middle_json is not None:
+        logger.info("Step 1: Using cached MinerU layout for %s", pdf_path)
+    else:
+        logger.info("Step 1: Running MinerU layout analysis on %s", pdf_path)
+        ocr_engine = get_ocr_engine("mineru")
+        if hasattr(ocr_engine, "configure"):
+            ocr_engine.configure(**mineru_options)
+
+        ocr_engine.set_pdf_path(pdf_path)
+        ocr_engine.extract_from_pdf(pdf_path)
+
+        middle_json = ocr_engine.get_layout_data()
+        if middle_json is None:
+            raise RuntimeError("MinerU did not produce layout data (middle_json). Is MinerU v2.x installed?")
+        if cache_key:
+            try:
+                store_cached_layout(cache_key, middle_json)
+            except (OSError, TypeError) as e:
+                logger.warning("Could not write MinerU layout cache entry for %s: %s", pdf_path, e)
 
     t1 = time.monotonic()
     logger.info("MinerU analysis done in %.1fs", t1 - t0)
@@ -87,8 +106,8 @@ def crop_and_explain(
 
     # 3. Crop question images
     logger.info("Step 3: Cropping %d question images at %d DPI", len(regions), dpi)
-    cropper = QuestionCropper(pdf_path, dpi=dpi)
-    questions = cropper.crop_regions(regions, output_dir=output_dir)
+    cropper = QuestionCropper(pdf_path, dpi=dpi, grayscale=grayscale)
+    questions = cropper.crop_regions(regions, output_dir=output_dir, workers=crop_workers)
 
     t3 = time.monotonic()
     logger.info("Cropping done in %.1fs", t3 - t2)
@@ -96,7 +115,7 @@ def crop_and_explain(
     # 4. Generate explanations (optional)
     if add_explanations:
         logger.info("Step 4: Generating explanations via Gemini Vision")
-        explainer = QuestionExplainer(llm_name=llm_name)
+        explainer = QuestionExplainer(llm_name=llm_name, use_cache=use_cache)
         questions = explainer.add_explanations(questions)
         t4 = time.monotonic()
         logger.info("Explanations done in %.1fs", t4 - t3)
@@ -114,5 +133,6 @@ def crop_and_explain(
             "crop_time": round(t3 - t2, 1),
             "total_time": round(total_time, 1),
             "dpi": dpi,
+            "grayscale": grayscale,
         },
     )
@@ -4,12 +4,18 @@ Question explanation generator using Gemini Vision.
 """
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from ..result_cache import explanation_cache_key, load_cached_explanation, store_cached_explanation
 from ..schema import CroppedQuestion
 
 logger = logging.getLogger(__name__)
 
+# Gemini calls in flight at once; each is a network round-trip, so threads overlap them
+_DEFAULT_MAX_CONCURRENCY = 8
+
 _EXPLANATION_PROMPT = """이 시험 문제 이미지를 분석하고 해설을 작성하세요.
 
 ## 요구사항
@@ -32,33 +38,42 @@ _EXPLANATION_PROMPT = """이 시험 문제 이미지를 분석하고 해설을 
 class QuestionExplainer:
     """Generate explanations for cropped question images using Gemini Vision."""
 
-    def __init__(self, llm_name: str = "gemini-3-pro-preview"):
+    def __init__(self, llm_name: str = "gemini-3-pro-preview", use_cache: bool = True):
+        """
+        Args:
+            llm_name: Gemini model name
+            use_cache: Reuse explanations cached for identical crop images (see result_cache)
+        """
         self._llm_name = llm_name
+        self._use_cache = use_cache
         self._client = None
+        self._client_lock = threading.Lock()
+        self._usage_lock = threading.Lock()
         self._total_input_tokens = 0
         self._total_output_tokens = 0
 
     def _ensure_client(self):
-        """Lazy-init the Gemini client."""
-        if self._client is not None:
-            return
-        from google import genai
+        """Lazy-init the Gemini client (once, even when called from several threads)."""
+        with self._client_lock:
+            if self._client is not None:
+                return
+            from google import genai
 
-        self._client = genai.Client()
+            self._client = genai.Client()
 
     def explain_question(self, question: CroppedQuestion) -> str:
         """
         Send a cropped question image to Gemini and get an explanation.
 
+        An image explained before (same PNG bytes, model and prompt) is answered
+        from the on-disk cache without calling Gemini.
+
         Args:
             question: CroppedQuestion with image_path set
 
         Returns:
             Explanation text
         """
-        self._ensure_client()
-        from google.genai.types import GenerateContentConfig, Part
-
         prompt = _EXPLANATION_PROMPT.format(q_num=question.question_number)
 
         # Read image bytes from file
@@ -68,6 +83,16 @@ class QuestionExplainer:
             return ""
 
         img_bytes = img_path.read_bytes()
+        cache_key = explanation_cache_key(img_bytes, self._llm_name, prompt) if self._use_cache else None
+        if cache_key:
+            cached = load_cached_explanation(cache_key)
+            if cached is not None:
+                logger.debug("Explanation cache hit for question %d", question.question_number)
+                return cached
+
+        self._ensure_client()
+        from google.genai.types import GenerateContentConfig, Part
+
         image_part = Part.from_bytes(data=img_bytes, mime_type="image/png")
 
         response = self._client.models.generate_content(
@@ -80,31 +105,58 @@ class QuestionExplainer:
         )
 
         if response.usage_metadata:
-            self._total_input_tokens += response.usage_metadata.prompt_token_count or 0
-            self._total_output_tokens += response.usage_metadata.candidates_token_count or 0
+            with self._usage_lock:
+                self._total_input_tokens += response.usage_metadata.prompt_token_count or 0
+                self._total_output_tokens += response.usage_metadata.candidates_token_count or 0
 
-        return response.text or ""
-
-    def add_explanations(self, questions: list[CroppedQuestion]) -> list[CroppedQuestion]:
+        text = response.text or ""
+        if cache_key and text:
+            try:
+                store_cached_explanation(cache_key, text)
+            except OSError as e:
+                logger.warning("Could not write explanation cache entry for question %d: %s",
+                               question.question_number, e)
+        return text
+
+    def _explain_into(self, question: CroppedQuestion) -> None:
+        """Set question.explanation, logging (not raising) a failed Gemini call."""
+        try:
+            question.explanation = self.explain_question(question)
+            logger.info("Generated explanation for question %d", question.question_number)
+        except Exception:
+            logger.exception("Failed to generate explanation for question %d", question.question_number)
+            question.explanation = None
+
+    def add_explanations(
+        self, questions: list[CroppedQuestion], max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
+    ) -> list[CroppedQuestion]:
         """
         Add explanations to all cropped questions.
 
+        Questions are explained concurrently on a thread pool, since each
+        Gemini call is an independent network round-trip.
+
         Args:
             questions: List of CroppedQuestion with image_path set
+            max_concurrency: Gemini calls in flight at once (default 8)
 
         Returns:
             Same list with explanation field populated
         """
+        pending = []
         for q in questions:
             if not q.image_path:
                 logger.warning("Question %d has no image_path, skipping explanation", q.question_number)
                 continue
-            try:
-                q.explanation = self.explain_question(q)
-                logger.info("Generated explanation for question %d", q.question_number)
-            except Exception:
-                logger.exception("Failed to generate explanation for question %d", q.question_number)
-                q.explanation = None
+            pending.append(q)
+
+        workers = min(max(1, max_concurrency), len(pending))
+        if workers <= 1:
+            for q in pending:
+                self._explain_into(q)
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="explain") as executor:
+                list(executor.map(self._explain_into, pending))
         return questions
 
     def get_token_usage(self) -> tuple[int, int]:
@@ -11,6 +11,13 @@ from pydantic import BaseModel
 
 from .schema import AnswerEntry, AnswerKey, Choice, ParsedExam
 
+try:
+    from rapidfuzz import fuzz
+    from rapidfuzz.process import cpdist
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
 # ---------------------------------------------------------------------------
 # Evaluation result models
 # ---------------------------------------------------------------------------
@@ -261,33 +268,45 @@ def _parse_sub_question(raw: str, shared_passage: str | None) -> AnswerEntry | N
 
 
 def similarity(a: str, b: str) -> float:
-    """Return SequenceMatcher ratio between two strings (0.0-1.0)."""
+    """Return case-insensitive similarity ratio between two strings (0.0-1.0).
+
+    Uses rapidfuzz's normalized Indel similarity (C, SIMD) when installed and
+    falls back to difflib's SequenceMatcher ratio otherwise.
+    """
     if not a and not b:
         return 1.0
     if not a or not b:
         return 0.0
+    if HAS_RAPIDFUZZ:
+        return fuzz.ratio(a.lower(), b.lower()) / 100
     return SequenceMatcher(None, a.lower(), b.lower()).ratio()
 
 
-def _choice_accuracy(pred_choices: list[Choice], gt_choices: list[Choice]) -> tuple[int, int]:
-    """Return (correctly_matched, total_gt_choices).
+def similarities(pairs: list[tuple[str, str]], workers: int = 1) -> list[float]:
+    """similarity() for many (a, b) pairs, scored in one vectorized rapidfuzz call when available.
 
-    A choice is 'correct' if the extracted choice with the same number has
-    text similarity >= 0.5 with the ground truth text.
+    ``workers`` is passed to rapidfuzz (-1 = all cores); worth it for long texts such as passages.
+    """
+    if not HAS_RAPIDFUZZ or not pairs:
+        return [similarity(a, b) for a, b in pairs]
+    scores = cpdist(
+        [a.lower() for a, _ in pairs], [b.lower() for _, b in pairs], scorer=fuzz.ratio, workers=workers,
+    ).tolist()
+    return [
+        (1.0 if not a and not b else 0.0) if not a or not b else score / 100
+        for (a, b), score in zip(pairs, scores)
+    ]
+
+
+def _choice_pairs(pred_choices: list[Choice], gt_choices: list[Choice]) -> list[tuple[str, str]]:
+    """(extracted text, ground truth text) for each ground-truth choice number.
+
+    evaluate() counts a choice as 'correct' if the extracted choice with the same
+    number has text similarity >= 0.5 with the ground truth text.
     """
-    if not gt_choices:
-        return 0, 0
-
     gt_map = {c.number: c.text for c in gt_choices}
     pred_map = {c.number: c.text for c in pred_choices}
-
-    correct = 0
-    for num, gt_text in gt_map.items():
-        pred_text = pred_map.get(num, "")
-        if similarity(pred_text, gt_text) >= 0.5:
-            correct += 1
-
-    return correct, len(gt_choices)
+    return [(pred_map.get(num, ""), gt_text) for num, gt_text in gt_map.items()]
 
 
 def evaluate(parsed_exam: ParsedExam, answer_key: AnswerKey, model_name: str = "") -> EvalResult:
@@ -302,6 +321,24 @@ def evaluate(parsed_exam: ParsedExam, answer_key: AnswerKey, model_name: str = "
     gt_by_number = {e.number: e for e in answer_key.entries}
     pred_by_number = {q.number: q for q in parsed_exam.questions}
 
+    # Collect every text pair of the found questions first, then score each kind in one
+    # similarities() batch (one rapidfuzz cpdist call each) instead of per question
+    found_numbers = [n for n in sorted(gt_by_number) if n in pred_by_number]
+    passage_pairs = []
+    qt_pairs = []
+    choice_pairs: list[tuple[str, str]] = []
+    choice_ends = []
+    for number in found_numbers:
+        pred, gt = pred_by_number[number], gt_by_number[number]
+        passage_pairs.append((pred.passage or "", gt.passage or ""))
+        qt_pairs.append((pred.question_text or "", gt.question_text or ""))
+        choice_pairs.extend(_choice_pairs(pred.choices, gt.choices))
+        choice_ends.append(len(choice_pairs))
+    passage_scores = iter(similarities(passage_pairs, workers=-1))
+    qt_scores = iter(similarities(qt_pairs))
+    choice_scores = similarities(choice_pairs)
+    choice_bounds = iter(zip([0, *choice_ends], choice_ends))
+
     per_question: list[QuestionEval] = []
 
     passage_sims: list[float] = []
@@ -328,14 +365,16 @@ def evaluate(parsed_exam: ParsedExam, answer_key: AnswerKey, model_name: str = "
             continue
 
         # Passage similarity
-        p_sim = similarity(pred.passage or "", gt.passage or "")
+        p_sim = next(passage_scores)
 
         # Choice accuracy
-        correct, total = _choice_accuracy(pred.choices, gt.choices)
+        start, end = next(choice_bounds)
+        correct = sum(1 for sim in choice_scores[start:end] if sim >= 0.5)
+        total = len(gt.choices)
         c_acc = correct / total if total > 0 else 1.0  # no choices → full credit
 
         # Question text similarity
-        qt_sim = similarity(pred.question_text, gt.question_text)
+        qt_sim = next(qt_scores)
 
         per_question.append(
             QuestionEval(
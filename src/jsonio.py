@@ -0,0 +1,126 @@
+"""
+JSON read/write helpers for the CLI scripts.
+스크립트 결과 JSON을 빠르게 직렬화/저장/로드하는 헬퍼입니다.
+
+Uses orjson when installed (several times faster than the stdlib encoder with
+indent=2, and a C parser that reads UTF-8 bytes directly) and falls back to the
+stdlib json module otherwise. Output is UTF-8 with non-ASCII characters kept
+as-is, matching ``json.dump(..., ensure_ascii=False)``.
+"""
+
+import json
+import logging
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+logger = logging.getLogger(__name__)
+
+
+def dumps_bytes(obj, indent: bool = True) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes (2-space indent by default)."""
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
+
+def loads(data: bytes | str):
+    """Parse JSON from bytes or str; orjson parses the raw UTF-8 bytes directly when installed."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def read_json(path: str | Path):
+    """Load a JSON file."""
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def _same_contents(path: str | Path, data: bytes) -> bool:
+    """True if path already holds exactly data (size check first, so mismatches are cheap)."""
+    try:
+        if os.stat(path).st_size != len(data):
+            return False
+        with open(path, "rb") as f:
+            return f.read() == data
+    except OSError:
+        return False
+
+
+def write_bytes(path: str | Path, data: bytes, skip_unchanged: bool = False) -> bool:
+    """Write already-encoded bytes with raw os.write calls (no TextIOWrapper/BufferedWriter layer).
+
+    With ``skip_unchanged``, an existing file with identical contents is left alone
+    (no truncate/rewrite, no dirty pages). Returns True if the file was written.
+    """
+    if skip_unchanged and _same_contents(path, data):
+        return False
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+    return True
+
+
+def write_json(path: str | Path, obj, indent: bool = True) -> None:
+    """Serialize obj and write it to path in one call."""
+    write_bytes(path, dumps_bytes(obj, indent=indent))
+
+
+class BackgroundWriter:
+    """Write (path, bytes) payloads on a small thread pool and collect the outcome in drain().
+
+    Lets the caller keep working (evaluation, rendering the next file) while the
+    previous files are written. Usable as a context manager; leaving the block
+    drains outstanding writes and shuts the pool down. Failures not already
+    collected with drain() are logged and the first one is re-raised (unless the
+    block is exiting on an exception of its own, which is left to propagate).
+    """
+
+    def __init__(self, max_workers: int = 2, skip_unchanged: bool = False):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="writer")
+        self._pending: list[tuple[Path, Future]] = []
+        self._skip_unchanged = skip_unchanged
+
+    def submit(self, path: str | Path, data: bytes) -> None:
+        future = self._executor.submit(write_bytes, path, data, self._skip_unchanged)
+        self._pending.append((Path(path), future))
+
+    def drain(self) -> dict[Path, BaseException]:
+        """Wait for all submitted writes; return the failures keyed by path."""
+        errors = {}
+        for path, future in self._pending:
+            exc = future.exception()
+            if exc is not None:
+                errors[path] = exc
+        self._pending.clear()
+        return errors
+
+    def close(self) -> dict[Path, BaseException]:
+        errors = self.drain()
+        self._executor.shutdown()
+        return errors
+
+    def __enter__(self) -> "BackgroundWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        errors = self.close()
+        for path, err in errors.items():
+            logger.error("Background write to %s failed: %s", path, err)
+        if errors and exc_type is None:
+            raise next(iter(errors.values()))
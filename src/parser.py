@@ -7,11 +7,13 @@ Layer 2: LLM (Gemini/GPT) structures text into ParsedExam JSON
 Layer 3: Validator checks completeness and accuracy
 """
 
+import asyncio
 import logging
+import threading
 import time
 from pathlib import Path
 
-from .config import MODEL_CONFIG
+from .config import MODEL_CONFIG, get_settings
 from .models.hybrid_client import HybridOCRClient
 from .pdf_parser import PDFParser
 from .schema import ExamInfo, ParsedExam, ParseResult
@@ -27,9 +29,30 @@ class ExamParser:
 
     SUPPORTED_MODELS = {name: HybridOCRClient for name in HYBRID_MODELS}
 
-    def __init__(self, pdf_path: str, dpi: int = 200):
+    def __init__(self, pdf_path: str, dpi: int = 200, page_images: list[tuple[bytes, str]] | None = None):
+        """
+        Args:
+            pdf_path: Path to exam PDF file
+            dpi: Resolution for page rendering
+            page_images: Pre-rendered (image_bytes, mime_type) pages at this DPI.
+                Lets callers that already rasterized the PDF skip re-rendering.
+                Otherwise pages are rendered on first use and shared by every model.
+        """
         self.pdf_parser = PDFParser(pdf_path, dpi=dpi)
         self.pdf_path = Path(pdf_path)
+        self._page_images = page_images
+        self._render_lock = threading.Lock()
+
+    def get_page_images(self) -> list[tuple[bytes, str]]:
+        """Rendered pages, rasterized once per parser and reused across models.
+
+        Thread-safe: concurrent parse_with_model calls (run_comparison) render only once.
+        """
+        if self._page_images is None:
+            with self._render_lock:
+                if self._page_images is None:
+                    self._page_images = self.pdf_parser.get_page_images_as_bytes()
+        return self._page_images
 
     def parse_with_model(
         self,
@@ -51,7 +74,7 @@ class ExamParser:
             images = []
             pages_processed = self.pdf_parser.page_count
         else:
-            images = self.pdf_parser.get_page_images_as_bytes()
+            images = self.get_page_images()
             pages_processed = len(images)
 
         parsed_exam = client.parse_exam(images, instruction=instruction)
@@ -76,28 +99,57 @@ class ExamParser:
 
         return result
 
+    def _parse_or_error(self, model_name: str, instruction: str | None = None) -> ParseResult:
+        """parse_with_model, with a failure turned into an error ParseResult."""
+        try:
+            logger.info("Parsing with %s...", model_name)
+            result = self.parse_with_model(model_name, instruction=instruction)
+            logger.info("  %s done in %.2fs", model_name, result.parsing_time_seconds)
+            return result
+        except Exception as e:
+            logger.error("  %s failed: %s", model_name, e)
+            return ParseResult(
+                model_name=model_name,
+                parsed_exam=ParsedExam(exam_info=ExamInfo(title=""), questions=[]),
+                error=str(e),
+            )
+
     def parse_with_all_models(
         self,
         instruction: str | None = None,
     ) -> dict[str, ParseResult]:
-        """Parse exam using all available hybrid models."""
-        results: dict[str, ParseResult] = {}
-
-        for model_name in HYBRID_MODELS:
-            try:
-                logger.info("Parsing with %s...", model_name)
-                result = self.parse_with_model(model_name, instruction=instruction)
-                results[model_name] = result
-                logger.info("  %s done in %.2fs", model_name, result.parsing_time_seconds)
-            except Exception as e:
-                logger.error("  %s failed: %s", model_name, e)
-                results[model_name] = ParseResult(
-                    model_name=model_name,
-                    parsed_exam=ParsedExam(exam_info=ExamInfo(title=""), questions=[]),
-                    error=str(e),
-                )
-
-        return results
+        """Parse exam using all available hybrid models, one after another."""
+        return {m: self._parse_or_error(m, instruction=instruction) for m in HYBRID_MODELS}
+
+    async def aparse_with_all_models(
+        self,
+        instruction: str | None = None,
+        max_concurrency: int | None = None,
+    ) -> dict[str, ParseResult]:
+        """Parse exam using all available hybrid models concurrently.
+
+        Each model runs in a worker thread; rendered pages are shared through
+        get_page_images(). Every hybrid model runs its own MinerU analysis of the
+        PDF in this process, so the default is capped like the server's workers.
+
+        Args:
+            instruction: Optional custom parsing instruction
+            max_concurrency: Models in flight at once
+                (default: settings.MAX_CONCURRENT_PARSES, at most 4)
+
+        Returns:
+            Results keyed by model name, in HYBRID_MODELS order.
+        """
+        if max_concurrency is None:
+            max_concurrency = min(get_settings().MAX_CONCURRENT_PARSES, 4)
+        sem = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run_one(model_name: str) -> ParseResult:
+            async with sem:
+                return await asyncio.to_thread(self._parse_or_error, model_name, instruction)
+
+        results = await asyncio.gather(*(run_one(m) for m in HYBRID_MODELS))
+        return dict(zip(HYBRID_MODELS, results))
 
     @staticmethod
     def _calculate_cost(model_name: str, input_tokens: int, output_tokens: int) -> float:
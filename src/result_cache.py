@@ -0,0 +1,195 @@
+"""
+On-disk cache of ParseResult objects for the comparison/full-flow scripts,
+and of MinerU layout data (middle_json) and Gemini explanations for the
+cropping pipeline.
+동일한 입력(PDF 내용, 모델, DPI)에 대한 파싱 결과를 디스크에 캐시합니다.
+
+Re-running a script after tweaking report formatting should not re-pay the
+OCR + LLM cost, so results are stored under a key derived from the PDF bytes,
+the model name, the DPI, the instruction, the MinerU options and a fingerprint
+of the parsing code (model config, prompt, parser, OCR/LLM clients, schema), so editing any of
+those misses the old entries instead of serving stale results. Layouts are keyed
+by the PDF bytes and the MinerU options; explanations by the crop image bytes,
+LLM and prompt.
+
+Location (configurable via env var):
+  EXAM_PARSER_CACHE_DIR — cache directory (default: $XDG_CACHE_HOME/exam_pdf_parser
+                          or ~/.cache/exam_pdf_parser)
+"""
+
+import hashlib
+import logging
+import os
+from functools import lru_cache
+from pathlib import Path
+
+from .config import get_settings
+from .jsonio import dumps_bytes, read_json
+from .schema import ParseResult
+
+logger = logging.getLogger(__name__)
+
+_HASH_CHUNK_SIZE = 1 << 20
+
+# Bump when the stored ParseResult layout changes in a way the code fingerprint can't see
+_PARSE_CACHE_VERSION = 1
+# Sources (relative to src/) whose edits can change a ParseResult (config.py holds MODEL_CONFIG:
+# backend model and pricing); directories are read recursively
+_PARSE_CODE_PATHS = ("config.py", "parser.py", "pdf_parser.py", "prompt.py", "schema.py", "models", "ocr")
+
+
+def get_cache_dir() -> Path:
+    """Return the cache directory (not created until the first write)."""
+    override = os.getenv("EXAM_PARSER_CACHE_DIR")
+    if override:
+        return Path(override)
+    base = os.getenv("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "exam_pdf_parser"
+
+
+def _hash_pdf(pdf_path: str | Path):
+    """blake2b hasher primed with the PDF contents (read in chunks)."""
+    h = hashlib.blake2b(digest_size=20)
+    with open(pdf_path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            h.update(chunk)
+    return h
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write via tmp file + rename so readers never see a partial entry."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f"{path.suffix}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+@lru_cache(maxsize=1)
+def _parse_code_fingerprint() -> bytes:
+    """Digest of the parsing source files (read once per process)."""
+    src_dir = Path(__file__).parent
+    h = hashlib.blake2b(str(_PARSE_CACHE_VERSION).encode("ascii"), digest_size=20)
+    for name in _PARSE_CODE_PATHS:
+        path = src_dir / name
+        for source in sorted(path.rglob("*.py")) if path.is_dir() else (path,):
+            h.update(b"\0" + source.relative_to(src_dir).as_posix().encode("utf-8") + b"\0")
+            h.update(source.read_bytes())
+    return h.digest()
+
+
+def _mineru_options() -> tuple:
+    """The MINERU_* settings that shape the OCR output fed to the LLM."""
+    settings = get_settings()
+    return (
+        settings.MINERU_LANGUAGE,
+        settings.MINERU_PARSE_METHOD,
+        settings.MINERU_FORMULA_ENABLE,
+        settings.MINERU_TABLE_ENABLE,
+        settings.MINERU_MAKE_MODE,
+    )
+
+
+def cache_key(
+    pdf_path: str | Path, model_name: str, dpi: int, instruction: str | None = None, mineru_options: tuple = (),
+) -> str:
+    """blake2b digest over the PDF contents, every parameter that changes the result and the parsing code."""
+    h = _hash_pdf(pdf_path)
+    h.update(b"\0" + model_name.encode("utf-8"))
+    h.update(b"\0" + str(dpi).encode("ascii"))
+    h.update(b"\0" + (instruction or "").encode("utf-8"))
+    h.update(b"\0" + repr(mineru_options).encode("utf-8"))
+    h.update(b"\0" + _parse_code_fingerprint())
+    return h.hexdigest()
+
+
+def load_cached(key: str) -> ParseResult | None:
+    """Return the cached ParseResult for key (flagged ``cached``), or None on a miss or unreadable entry."""
+    path = get_cache_dir() / f"{key}.json"
+    try:
+        result = ParseResult.model_validate_json(path.read_bytes())
+        result.cached = True
+        return result
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning("Ignoring unreadable cache entry %s: %s", path, e)
+        return None
+
+
+def store_cached(key: str, result: ParseResult) -> None:
+    """Write result atomically (tmp file + rename) so readers never see a partial entry."""
+    _write_atomic(get_cache_dir() / f"{key}.json", result.model_dump_json().encode("utf-8"))
+
+
+def layout_cache_key(pdf_path: str | Path, mineru_options: tuple) -> str:
+    """blake2b digest over the PDF contents and the MinerU options that shape the layout."""
+    h = _hash_pdf(pdf_path)
+    h.update(b"\0mineru\0" + repr(mineru_options).encode("utf-8"))
+    return h.hexdigest()
+
+
+def load_cached_layout(key: str) -> dict | None:
+    """Return the cached MinerU middle_json for key, or None on a miss or unreadable entry."""
+    path = get_cache_dir() / f"{key}.mineru.json"
+    try:
+        return read_json(path)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning("Ignoring unreadable layout cache entry %s: %s", path, e)
+        return None
+
+
+def store_cached_layout(key: str, middle_json: dict) -> None:
+    """Write a MinerU middle_json atomically (compact JSON)."""
+    _write_atomic(get_cache_dir() / f"{key}.mineru.json", dumps_bytes(middle_json, indent=False))
+
+
+def explanation_cache_key(image_bytes: bytes, llm_name: str, prompt: str) -> str:
+    """blake2b digest over a question crop's PNG bytes, the LLM and the prompt."""
+    h = hashlib.blake2b(image_bytes, digest_size=20)
+    h.update(b"\0" + llm_name.encode("utf-8"))
+    h.update(b"\0" + prompt.encode("utf-8"))
+    return h.hexdigest()
+
+
+def load_cached_explanation(key: str) -> str | None:
+    """Return the cached explanation text for key, or None on a miss."""
+    try:
+        return (get_cache_dir() / "explanations" / f"{key}.txt").read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def store_cached_explanation(key: str, text: str) -> None:
+    """Write an explanation atomically."""
+    _write_atomic(get_cache_dir() / "explanations" / f"{key}.txt", text.encode("utf-8"))
+
+
+def parse_with_cache(parser, model_name: str, use_cache: bool = True, instruction: str | None = None) -> ParseResult:
+    """``parser.parse_with_model`` with a disk cache in front of it.
+
+    Args:
+        parser: ExamParser for the PDF
+        model_name: Model to parse with
+        use_cache: False bypasses the cache entirely (no read, no write)
+        instruction: Optional custom parsing instruction (part of the key)
+
+    A cache hit comes back with ``cached=True``; its ``parsing_time_seconds`` is
+    the original run's, so callers should not rank it by speed.
+    """
+    if not use_cache:
+        return parser.parse_with_model(model_name, instruction=instruction)
+
+    key = cache_key(parser.pdf_path, model_name, parser.pdf_parser.dpi, instruction, _mineru_options())
+    cached = load_cached(key)
+    if cached is not None:
+        logger.info("Cache hit for %s (%s)", parser.pdf_path.name, model_name)
+        return cached
+
+    result = parser.parse_with_model(model_name, instruction=instruction)
+    try:
+        store_cached(key, result)
+    except OSError as e:
+        logger.warning("Could not write cache entry for %s: %s", model_name, e)
+    return result
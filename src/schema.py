@@ -150,6 +150,8 @@ class ParseResult(BaseModel):
     pages_processed: int = 0
     ocr_metrics: OCRMetrics | None = None
     error: str | None = None
+    # Served from result_cache (not serialized); parsing_time_seconds is then the original run's
+    cached: bool = Field(False, exclude=True)
 
 
 class QuestionRegion(BaseModel):